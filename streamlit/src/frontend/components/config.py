@@ -40,3 +40,6 @@ def get_usdc_address() -> Tuple[Optional[str], str]:
     addr = os.getenv(USDC_ADDRESS_ENV)
     return (addr, USDC_ADDRESS_ENV) if addr else (None, "")
 
+
+# Optional Multicall3 override (defaults to the canonical deployment address)
+MULTICALL3_ADDRESS_ENV = "MULTICALL3_ADDRESS"
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import json
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 import os
 import pandas as pd
@@ -11,6 +11,15 @@ import streamlit as st
 from web3 import Web3
 from web3.exceptions import Web3Exception
 
+from .multicall import (
+    batch_calls,
+    contract_call,
+    decode_call_result,
+    eth_balance_call,
+    multicall_supported,
+)
+from .web3_utils import checksum_address, install_rpc_cache, load_contract, rpc_executor
+
 
 @st.cache_resource(show_spinner=False)
 def get_web3_client(rpc: str) -> Optional[Web3]:
@@ -18,8 +27,20 @@ def get_web3_client(rpc: str) -> Optional[Web3]:
 
     if not rpc:
         return None
-    client = Web3(Web3.HTTPProvider(rpc, request_kwargs={"timeout": 10}))
-    return client if client.is_connected() else None
+    # No is_connected() probe here: connectivity is validated by the first real RPC instead.
+    return install_rpc_cache(Web3(Web3.HTTPProvider(rpc, request_kwargs={"timeout": 10})))
+
+
+def _parallel(calls: dict[str, Callable[[], Any]]) -> dict[str, tuple[Any, Optional[BaseException]]]:
+    """Run ``calls`` concurrently and return ``{key: (result, exception)}`` once all finish."""
+
+    executor = rpc_executor()
+    futures = {key: executor.submit(fn) for key, fn in calls.items()}
+    outcomes: dict[str, tuple[Any, Optional[BaseException]]] = {}
+    for key, future in futures.items():
+        exc = future.exception()
+        outcomes[key] = (None, exc) if exc is not None else (future.result(), None)
+    return outcomes
 
 
 def _resolve_session_dataframe(session_key: str) -> Optional[pd.DataFrame]:
@@ -40,12 +61,13 @@ def render_intro_page() -> None:
     df = _resolve_session_dataframe("invoice_df")
 
     w3 = get_web3_client(rpc_url) if rpc_url else None
-    if rpc_url and not w3:
-        st.warning("Unable to connect to the provided RPC endpoint. Double-check the URL or network status.")
 
-    balance = _fetch_wallet_balance(w3, wallet_address) if w3 and wallet_address else None
+    balance, credit_score = (
+        _fetch_onchain_snapshot(w3, wallet_address, contract_address, abi_text)
+        if w3 and wallet_address
+        else (None, None)
+    )
     avg_delay, invoice_count = _compute_invoice_metrics(df)
-    credit_score = _fetch_credit_score(w3, wallet_address, contract_address, abi_text)
 
     col1, col2, col3 = st.columns(3)
     col1.metric("Wallet Balance (USDC)", f"{balance:.2f}" if balance is not None else "—")
@@ -66,13 +88,81 @@ def render_intro_page() -> None:
                 st.line_chart(df[numeric_cols])
 
 
-def _fetch_wallet_balance(web3_client: Web3, wallet_address: str) -> Optional[float]:
+def _fetch_onchain_snapshot(
+    web3_client: Web3,
+    wallet_address: str,
+    contract_address: Optional[str],
+    abi_text: Optional[str],
+) -> tuple[Optional[float], Optional[Any]]:
+    """Read the wallet balance and registry score in a single Multicall3 round-trip."""
+
     try:
-        checksum_address = Web3.to_checksum_address(wallet_address)
-        raw_balance = web3_client.eth.get_balance(checksum_address)
-        return raw_balance / (10**18)
+        checksum_wallet = checksum_address(wallet_address)
     except ValueError:
         st.error("Wallet address is invalid. Please enter a valid checksum address.")
+        return None, None
+
+    score_fn = _build_score_call(web3_client, checksum_wallet, contract_address, abi_text)
+    if not multicall_supported(web3_client):
+        return _fetch_snapshot_parallel(web3_client, checksum_wallet, score_fn)
+
+    calls = [eth_balance_call(checksum_wallet)]
+    if score_fn is not None:
+        calls.append(contract_call(score_fn))
+
+    try:
+        results = batch_calls(web3_client, calls)
+    except OSError:  # requests connection/timeout errors
+        st.warning("Unable to connect to the provided RPC endpoint. Double-check the URL or network status.")
+        return None, None
+    except Exception as exc:  # pragma: no cover - UI feedback only
+        st.error(f"Unable to query chain: {exc}")
+        return None, None
+
+    balance = _decode_wallet_balance(web3_client, checksum_wallet, results[0])
+    credit_score = _decode_credit_score(score_fn, results[1]) if score_fn is not None else None
+    return balance, credit_score
+
+
+def _fetch_snapshot_parallel(
+    web3_client: Web3,
+    checksum_wallet: str,
+    score_fn: Any,
+) -> tuple[Optional[float], Optional[Any]]:
+    """Issue the balance and score reads concurrently when Multicall3 is unavailable."""
+
+    calls: dict[str, Callable[[], Any]] = {"balance": lambda: web3_client.eth.get_balance(checksum_wallet)}
+    if score_fn is not None:
+        calls["score"] = score_fn.call
+    outcomes = _parallel(calls)
+
+    raw_balance, balance_exc = outcomes["balance"]
+    if isinstance(balance_exc, OSError):  # requests connection/timeout errors
+        st.warning("Unable to connect to the provided RPC endpoint. Double-check the URL or network status.")
+        return None, None
+
+    balance = None
+    if balance_exc is not None:
+        st.error(f"Failed to fetch balance: {balance_exc}")
+    else:
+        balance = raw_balance / (10**18)
+
+    credit_score = None
+    if "score" in outcomes:
+        credit_score, score_exc = outcomes["score"]
+        if score_exc is not None:
+            st.error(f"Unable to query contract: {score_exc}")
+    return balance, credit_score
+
+
+def _decode_wallet_balance(web3_client: Web3, checksum_wallet: str, raw: Optional[bytes]) -> Optional[float]:
+    try:
+        if raw:
+            raw_balance = int.from_bytes(raw[-32:], byteorder="big")
+        else:
+            # Multicall3 unavailable on this chain; read the balance directly.
+            raw_balance = web3_client.eth.get_balance(checksum_wallet)
+        return raw_balance / (10**18)
     except Web3Exception as exc:  # pragma: no cover - UI feedback only
         st.error(f"Failed to fetch balance: {exc}")
     except Exception as exc:  # pragma: no cover - UI feedback only
@@ -88,26 +178,33 @@ def _compute_invoice_metrics(df: Optional[pd.DataFrame]) -> tuple[Optional[float
     return avg_delay, invoice_count
 
 
-def _fetch_credit_score(
-    web3_client: Optional[Web3],
-    wallet_address: Optional[str],
+def _build_score_call(
+    web3_client: Web3,
+    checksum_wallet: str,
     contract_address: Optional[str],
     abi_text: Optional[str],
 ) -> Optional[Any]:
-    if not (web3_client and wallet_address and contract_address and abi_text):
+    if not (contract_address and abi_text):
         return None
 
     try:
-        abi = json.loads(abi_text)
-        contract = web3_client.eth.contract(address=Web3.to_checksum_address(contract_address), abi=abi)
-        return contract.functions.scores(Web3.to_checksum_address(wallet_address)).call()
+        contract = load_contract(web3_client, contract_address, abi_text=abi_text)
+        return contract.functions.scores(checksum_wallet)
     except json.JSONDecodeError:
         st.error("ABI is not valid JSON. Please paste a valid ABI array.")
     except ValueError as exc:  # includes bad addresses
         st.error(f"Contract interaction error: {exc}")
-    except Web3Exception as exc:  # pragma: no cover - UI feedback only
-        st.error(f"Unable to query contract: {exc}")
     except Exception as exc:  # pragma: no cover - UI feedback only
         st.error(f"Unexpected contract error: {exc}")
     return None
 
+
+def _decode_credit_score(score_fn: Any, raw: Optional[bytes]) -> Optional[Any]:
+    if raw is None:
+        st.error("Unable to query contract: `scores` call reverted.")
+        return None
+    try:
+        return decode_call_result(score_fn, raw)
+    except Exception as exc:  # pragma: no cover - UI feedback only
+        st.error(f"Unable to decode contract response: {exc}")
+    return None
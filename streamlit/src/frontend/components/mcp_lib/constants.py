@@ -20,6 +20,7 @@ POOL_TOOL_ROLES = {
     "repay": "Borrower",
     "checkDefaultAndBan": "Owner",
     "unban": "Owner",
+    "unbanBatch": "Owner",
 }
 
 MCP_BRIDGE_SESSION_KEY = "mcp_cctp_bridge_state"
@@ -1,13 +1,14 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import os
 import logging
+from dataclasses import dataclass, field
 from decimal import Decimal, InvalidOperation
 from typing import Any, Dict, Optional
 
 import streamlit as st
-from web3 import Web3
 
 from ..config import (
     ARC_RPC_ENV,
@@ -19,7 +20,6 @@ from ..config import (
     USDC_DECIMALS_ENV,
     LENDING_POOL_ADDRESS_ENV,
     LENDING_POOL_ABI_PATH_ENV,
-    USDC_ADDRESS_ENV,
     USDC_ABI_PATH_ENV,
     BRIDGE_PRIVATE_KEY_ENV,
     POLYGON_RPC_ENV,
@@ -57,7 +57,7 @@ from ..web3_utils import get_web3_client, load_contract_abi
 from ..toolkit import build_llm_toolkit, build_lending_pool_toolkit, build_sbt_guard
 from ..toolkit_lib.config_utils import resolve_lending_pool_abi_path
 from ..wallet_connect_component import connect_wallet, wallet_command
-from ..web3_utils import get_web3_client, load_contract_abi
+from ..web3_utils import get_web3_client, load_contract, load_contract_abi
 from .logging_utils import get_metamask_logger
 from .rerun import st_rerun
 from .tool_runner import render_tool_runner
@@ -94,6 +94,45 @@ polygon_logger.propagate = False
 METAMASK_LOGGER = get_metamask_logger()
 
 
+@dataclass(frozen=True)
+class ArcEnv:
+    """Environment-derived settings for the MCP tools page, parsed once per process."""
+
+    rpc_url: Optional[str]
+    owner_private_key: Optional[str] = field(repr=False)
+    lender_private_key: Optional[str] = field(repr=False)
+    borrower_private_key: Optional[str] = field(repr=False)
+    gas_limit: int
+    gas_price_gwei: str
+    sbt_address: Optional[str]
+    sbt_env_name: str
+    sbt_abi_path: Optional[str]
+    pool_address: Optional[str]
+    pool_abi_path: Optional[str]
+    usdc_abi_path: Optional[str]
+    usdc_decimals: int
+
+
+@functools.lru_cache(maxsize=1)
+def _env() -> ArcEnv:
+    sbt_address, sbt_env_name = get_sbt_address()
+    return ArcEnv(
+        rpc_url=os.getenv(ARC_RPC_ENV),
+        owner_private_key=os.getenv(PRIVATE_KEY_ENV),
+        lender_private_key=os.getenv("LENDER_PRIVATE_KEY"),
+        borrower_private_key=os.getenv("BORROWER_PRIVATE_KEY"),
+        gas_limit=int(os.getenv(GAS_LIMIT_ENV, "200000")),
+        gas_price_gwei=os.getenv(GAS_PRICE_GWEI_ENV, "1"),
+        sbt_address=sbt_address,
+        sbt_env_name=sbt_env_name or SBT_ADDRESS_ENV,
+        sbt_abi_path=os.getenv(TRUSTMINT_SBT_ABI_PATH_ENV),
+        pool_address=os.getenv(LENDING_POOL_ADDRESS_ENV),
+        pool_abi_path=os.getenv(LENDING_POOL_ABI_PATH_ENV),
+        usdc_abi_path=os.getenv(USDC_ABI_PATH_ENV),
+        usdc_decimals=int(os.getenv(USDC_DECIMALS_ENV, "6")),
+    )
+
+
 def _resolve_polygon_address(role_addresses: Dict[str, str], connected_address: Optional[str]) -> Optional[str]:
     if connected_address:
         return connected_address
@@ -1119,10 +1158,10 @@ def render_mcp_tools_page() -> None:
     st.title("🧪 Direct MCP Tool Tester")
     st.caption("Run MCP tools for TrustMintSBT and LendingPool.")
 
-    rpc_url = os.getenv(ARC_RPC_ENV)
-    private_key_env = os.getenv(PRIVATE_KEY_ENV)
-    default_gas_limit = int(os.getenv(GAS_LIMIT_ENV, "200000"))
-    gas_price_gwei = os.getenv(GAS_PRICE_GWEI_ENV, "1")
+    env = _env()
+    rpc_url = env.rpc_url
+    default_gas_limit = env.gas_limit
+    gas_price_gwei = env.gas_price_gwei
 
     w3 = get_web3_client(rpc_url)
 
@@ -1198,9 +1237,9 @@ def render_mcp_tools_page() -> None:
     # User Verification Section
     _render_verification_section()
 
-    owner_pk = os.getenv(PRIVATE_KEY_ENV)
-    lender_pk = os.getenv("LENDER_PRIVATE_KEY")
-    borrower_pk = os.getenv("BORROWER_PRIVATE_KEY")
+    owner_pk = env.owner_private_key
+    lender_pk = env.lender_private_key
+    borrower_pk = env.borrower_private_key
 
     role_private_keys = {
         "Owner": owner_pk,
@@ -1223,18 +1262,16 @@ def render_mcp_tools_page() -> None:
     st.divider()
     st.subheader("TrustMint SBT Tools")
 
-    sbt_address_env = get_sbt_address()
-    sbt_address = sbt_address_env[0]
-    sbt_env_name = sbt_address_env[1] or SBT_ADDRESS_ENV
-    sbt_abi_path = os.getenv(TRUSTMINT_SBT_ABI_PATH_ENV)
+    sbt_address = env.sbt_address
+    sbt_env_name = env.sbt_env_name
+    sbt_abi_path = env.sbt_abi_path
 
     sbt_tools_schema = []
     sbt_function_map = {}
     sbt_guard = None
     if sbt_address and sbt_abi_path and w3 is not None:
-        sbt_abi = load_contract_abi(sbt_abi_path)
         try:
-            sbt_contract = w3.eth.contract(address=Web3.to_checksum_address(sbt_address), abi=sbt_abi)
+            sbt_contract = load_contract(w3, sbt_address, sbt_abi_path)
             sbt_tools_schema, sbt_function_map = build_llm_toolkit(
                 w3=w3,
                 contract=sbt_contract,
@@ -1265,19 +1302,17 @@ def render_mcp_tools_page() -> None:
     st.divider()
     st.subheader("LendingPool Tools")
 
-    pool_address = os.getenv(LENDING_POOL_ADDRESS_ENV)
-    pool_abi_path = os.getenv(LENDING_POOL_ABI_PATH_ENV)
-    usdc_address = os.getenv(USDC_ADDRESS_ENV)
-    usdc_abi_path = os.getenv(USDC_ABI_PATH_ENV)
-    usdc_decimals = int(os.getenv(USDC_DECIMALS_ENV, "6"))
+    pool_address = env.pool_address
+    pool_abi_path = env.pool_abi_path
+    usdc_abi_path = env.usdc_abi_path
+    usdc_decimals = env.usdc_decimals
 
     pool_tools_schema = []
     pool_function_map = {}
     if pool_address and pool_abi_path and w3 is not None:
-        pool_abi = load_contract_abi(pool_abi_path)
         usdc_abi = load_contract_abi(usdc_abi_path) if usdc_abi_path else None
         try:
-            pool_contract = w3.eth.contract(address=Web3.to_checksum_address(pool_address), abi=pool_abi)
+            pool_contract = load_contract(w3, pool_address, pool_abi_path)
             pool_tools_schema, pool_function_map = build_lending_pool_toolkit(
                 w3=w3,
                 pool_contract=pool_contract,
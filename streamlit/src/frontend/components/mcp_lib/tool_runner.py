@@ -36,6 +36,28 @@ def _normalise_chain_id(value: Any) -> Optional[int]:
     return None
 
 
+_EMPTY_DEFAULTS: Dict[str, Any] = {"integer": 0, "number": 0.0, "boolean": False, "array": [], "string": ""}
+
+
+def _typed_default(field_type: str, default: Any) -> Any:
+    """Coerce a schema default to the widget's value type; ``0``/``False`` are kept as given."""
+
+    if default is None:
+        return _EMPTY_DEFAULTS.get(field_type, "")
+    try:
+        if field_type == "integer":
+            return int(default)
+        if field_type == "number":
+            return float(default)
+    except (TypeError, ValueError):
+        return _EMPTY_DEFAULTS[field_type]
+    if field_type == "boolean":
+        return bool(default)
+    if field_type == "array":
+        return [str(item) for item in default] if isinstance(default, list) else []
+    return str(default)
+
+
 def render_tool_runner(
     tools_schema: list[Dict[str, Any]],
     function_map: Dict[str, Callable[..., str]],
@@ -53,7 +75,8 @@ def render_tool_runner(
         st.info("No MCP tools available. Check contract addresses and ABI paths.")
         return
 
-    tool_names = [entry["function"]["name"] for entry in tools_schema]
+    tools_by_name = {entry["function"]["name"]: entry for entry in tools_schema}
+    tool_names = list(tools_by_name)
     display_names = []
     for name in tool_names:
         role_label = (tool_role_map or {}).get(name)
@@ -442,41 +465,35 @@ def render_tool_runner(
             st_rerun()
         return
 
-    schema = next(item for item in tools_schema if item["function"]["name"] == selected)
-    parameters = schema["function"].get("parameters", {})
-    props = parameters.get("properties", {})
-    required = set(parameters.get("required", []))
+    parameters = tools_by_name[selected]["function"].get("parameters", {})
+    required = parameters.get("required", [])
+    overrides = (parameter_defaults or {}).get(selected, {})
 
     inputs: Dict[str, Any] = {}
-    for name, details in props.items():
+    for name, details in parameters.get("properties", {}).items():
         field_type = details.get("type", "string")
         label = f"{name} ({field_type})"
-        default = details.get("default")
-        if parameter_defaults:
-            default = parameter_defaults.get(selected, {}).get(name, default)
+        # Only the selected tool's fields are coerced, once per render.
+        default = _typed_default(field_type, overrides[name] if name in overrides else details.get("default"))
 
         widget_key = f"{key_prefix}_param_{selected}_{name}"
         if field_type == "integer":
-            value = st.number_input(label, value=int(default or 0), step=1, key=widget_key)
+            value = st.number_input(label, value=default, step=1, key=widget_key)
             inputs[name] = int(value)
         elif field_type == "number":
-            value = st.number_input(label, value=float(default or 0), key=widget_key)
+            value = st.number_input(label, value=default, key=widget_key)
             inputs[name] = float(value)
         elif field_type == "boolean":
-            inputs[name] = st.checkbox(label, value=bool(default) if default is not None else False, key=widget_key)
+            inputs[name] = st.checkbox(label, value=default, key=widget_key)
         elif field_type == "array":
             raw = st.text_area(
                 f"{label} (comma separated)",
-                value=", ".join(default or []) if isinstance(default, list) else "",
+                value=", ".join(default),
                 key=widget_key,
             )
             inputs[name] = [item.strip() for item in raw.split(",") if item.strip()]
         else:
-            inputs[name] = st.text_input(
-                label,
-                value=str(default) if default is not None else "",
-                key=widget_key,
-            )
+            inputs[name] = st.text_input(label, value=default, key=widget_key)
 
     disable_run = chain_mismatch or (requires_metamask_wallet and not wallet_connected)
     if st.button("Run MCP tool", key=f"{key_prefix}_run_tool", disabled=disable_run):
@@ -518,9 +535,9 @@ def render_tool_runner(
             mm_state = st.session_state.get(state_key, {}) if isinstance(st.session_state.get(state_key), dict) else {}
             mm_state["metamask"] = mm
             st.session_state[state_key] = mm_state
-            st.markdown("### MetaMask bridge")
-            render_wallet_section(mm_state, w3, key_prefix, selected)
-            st.stop()
+            # Buttons are one-shot: rerun so the wallet section renders from session state (above)
+            # on every subsequent run, instead of only inside this click's run.
+            st_rerun()
 
         try:
             if isinstance(parsed, (list, dict)):
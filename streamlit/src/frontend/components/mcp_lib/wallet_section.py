@@ -1,14 +1,18 @@
 from __future__ import annotations
 
+import functools
 import json
 from time import time
 from typing import Any, Dict, Optional
 
 import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
 from web3 import Web3
 
 from ..session import DEFAULT_SESSION_KEY
+from ..toolkit_lib.tx_helpers import poll_receipt
 from ..wallet_connect_component import wallet_command
+from ..web3_utils import get_web3_client
 from .logging_utils import get_metamask_logger
 from .rerun import st_rerun
 
@@ -35,15 +39,63 @@ def _normalise_chain_id(value: Any) -> Optional[int]:
     return None
 
 
+@st.cache_data(show_spinner=False, ttl=3600)
+def _cached_receipt(rpc_url: str, tx_hash: str) -> Dict[str, Any]:
+    """Wait for and summarise a receipt once per tx hash; reruns reuse the mined result."""
+    client = get_web3_client(rpc_url)
+    if client is None:
+        raise RuntimeError(f"Unable to connect to RPC endpoint {rpc_url}")
+    receipt = poll_receipt(client, tx_hash, timeout=120)
+    return {
+        "transactionHash": receipt.get("transactionHash").hex() if receipt.get("transactionHash") else tx_hash,
+        "status": receipt.get("status"),
+        "blockNumber": receipt.get("blockNumber"),
+        "gasUsed": receipt.get("gasUsed"),
+        "cumulativeGasUsed": receipt.get("cumulativeGasUsed"),
+    }
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_tx(raw: str) -> Optional[Dict[str, Any]]:
+    """Parse a JSON tx_request once per distinct string; None when it is not a JSON object."""
+    try:
+        parsed = json.loads(raw)
+    except json.JSONDecodeError:
+        return None
+    return parsed if isinstance(parsed, dict) else None
+
+
+def _rerun_wallet_section() -> None:
+    """Rerun just this fragment when it is itself rerunning, otherwise the whole app.
+
+    Fragment-scoped reruns are only valid during fragment reruns; when the fragment renders as
+    part of a full-app run (e.g. first render), Streamlit raises, so fall back to ``st_rerun``.
+    """
+    ctx = get_script_run_ctx()
+    if ctx is not None and ctx.fragment_ids_this_run:
+        st.rerun(scope="fragment")
+    st_rerun()
+
+
+def _queue_command(mm_state: Dict[str, Any], state_key: str, command: Dict[str, Any]) -> None:
+    """Store a MetaMask command and rerun so the headless component dispatches it."""
+    mm_state["pending_command"] = command
+    st.session_state[state_key] = mm_state
+    # The headless component already rendered this run; rerun (the fragment when possible) to dispatch.
+    _rerun_wallet_section()
+
+
+@st.fragment
 def render_wallet_section(mm_state: Dict[str, Any], w3: Web3, key_prefix: str, selected: str) -> None:
+    state_key = f"mm_state_{key_prefix}_{selected}"
     mm_payload = mm_state.get("metamask", {})
     tx_req = mm_payload.get("tx_request")
     if isinstance(tx_req, str):
-        try:
-            tx_req = json.loads(tx_req)
-        except json.JSONDecodeError:
+        parsed_tx = _parse_tx(tx_req)
+        if parsed_tx is None:
             st.warning("Tool provided tx_request that is not valid JSON.")
-            tx_req = None
+        # Copy so per-run mutations never leak into the shared cache entry.
+        tx_req = dict(parsed_tx) if parsed_tx is not None else None
     action = mm_payload.get("action") or "eth_sendTransaction"
     from_address = mm_payload.get("from")
     chain_id = mm_payload.get("chainId")
@@ -72,7 +124,7 @@ def render_wallet_section(mm_state: Dict[str, Any], w3: Web3, key_prefix: str, s
         )
         pending["logged"] = True
         mm_state["pending_command"] = pending
-        st.session_state[f"mm_state_{key_prefix}_{selected}"] = mm_state
+        st.session_state[state_key] = mm_state
     component_key = f"wallet_headless_{key_prefix}_{selected}"
     command = pending.get("command") if isinstance(pending, dict) else None
     command_payload = pending.get("payload") if isinstance(pending, dict) else None
@@ -152,8 +204,8 @@ def render_wallet_section(mm_state: Dict[str, Any], w3: Web3, key_prefix: str, s
                 wallet_chain_id,
                 required_chain_id,
             )
-            st.session_state[f"mm_state_{key_prefix}_{selected}"] = mm_state
-            st_rerun()
+            st.session_state[state_key] = mm_state
+            _rerun_wallet_section()
         required_hex = f"0x{required_chain_id:x}"
         actual_hex = f"0x{wallet_chain_id:x}"
         st.error(
@@ -180,53 +232,59 @@ def render_wallet_section(mm_state: Dict[str, Any], w3: Web3, key_prefix: str, s
 
     btn_cols = st.columns(3)
     if btn_cols[0].button("Connect wallet", key=f"btn_connect_{key_prefix}_{selected}"):
-        mm_state["pending_command"] = {
-            "command": "connect",
-            "payload": {},
-            "sequence": int(time() * 1000),
-            "reason": "user clicked Connect wallet button",
-            "logged": False,
-        }
         METAMASK_LOGGER.info(
             "MetaMask popup (connect) for MCP bridge '%s/%s'. Reason: user clicked Connect wallet button.",
             key_prefix,
             selected,
         )
-        st.session_state[f"mm_state_{key_prefix}_{selected}"] = mm_state
-        st_rerun()
+        _queue_command(
+            mm_state,
+            state_key,
+            {
+                "command": "connect",
+                "payload": {},
+                "sequence": int(time() * 1000),
+                "reason": "user clicked Connect wallet button",
+                "logged": False,
+            },
+        )
 
     if btn_cols[1].button("Switch network", key=f"btn_switch_{key_prefix}_{selected}"):
-        mm_state["pending_command"] = {
-            "command": "switch_network",
-            "payload": {"require_chain_id": chain_id},
-            "sequence": int(time() * 1000),
-            "reason": f"user requested switch to chain {chain_id}",
-            "logged": False,
-        }
         METAMASK_LOGGER.info(
             "MetaMask popup (switch_network) for MCP bridge '%s/%s'. Reason: user clicked Switch network button.",
             key_prefix,
             selected,
         )
-        st.session_state[f"mm_state_{key_prefix}_{selected}"] = mm_state
-        st_rerun()
+        _queue_command(
+            mm_state,
+            state_key,
+            {
+                "command": "switch_network",
+                "payload": {"require_chain_id": chain_id},
+                "sequence": int(time() * 1000),
+                "reason": f"user requested switch to chain {chain_id}",
+                "logged": False,
+            },
+        )
 
     send_disabled = tx_req is None or chain_mismatch
     if btn_cols[2].button("Send transaction", key=f"btn_send_{key_prefix}_{selected}", disabled=send_disabled):
-        mm_state["pending_command"] = {
-            "command": "send_transaction",
-            "payload": {"tx_request": tx_req, "action": action},
-            "sequence": int(time() * 1000),
-            "reason": "user clicked Send transaction button",
-            "logged": False,
-        }
         METAMASK_LOGGER.info(
             "MetaMask popup (send_transaction) for MCP bridge '%s/%s'. Reason: user clicked Send transaction button.",
             key_prefix,
             selected,
         )
-        st.session_state[f"mm_state_{key_prefix}_{selected}"] = mm_state
-        st_rerun()
+        _queue_command(
+            mm_state,
+            state_key,
+            {
+                "command": "send_transaction",
+                "payload": {"tx_request": tx_req, "action": action},
+                "sequence": int(time() * 1000),
+                "reason": "user clicked Send transaction button",
+                "logged": False,
+            },
+        )
 
     last_result = mm_state.get("last_result")
     if isinstance(last_result, dict):
@@ -235,14 +293,15 @@ def render_wallet_section(mm_state: Dict[str, Any], w3: Web3, key_prefix: str, s
         status = last_result.get("status")
         addr_for_session = last_result.get("address") or mm_state.get("wallet_address")
         chain_for_session = last_result.get("chainId") or mm_state.get("wallet_chain")
-        if addr_for_session:
-            st.session_state.setdefault(DEFAULT_SESSION_KEY, {})
-            if isinstance(st.session_state[DEFAULT_SESSION_KEY], dict):
-                st.session_state[DEFAULT_SESSION_KEY]["address"] = addr_for_session
-        if chain_for_session:
-            st.session_state.setdefault(DEFAULT_SESSION_KEY, {})
-            if isinstance(st.session_state[DEFAULT_SESSION_KEY], dict):
-                st.session_state[DEFAULT_SESSION_KEY]["chainId"] = chain_for_session
+        if addr_for_session or chain_for_session:
+            session_wallet = st.session_state.setdefault(DEFAULT_SESSION_KEY, {})
+            if not isinstance(session_wallet, dict):
+                session_wallet = {}
+                st.session_state[DEFAULT_SESSION_KEY] = session_wallet
+            if addr_for_session:
+                session_wallet["address"] = addr_for_session
+            if chain_for_session:
+                session_wallet["chainId"] = chain_for_session
         if error_msg:
             st.error(f"MetaMask command failed: {error_msg}")
         else:
@@ -254,19 +313,9 @@ def render_wallet_section(mm_state: Dict[str, Any], w3: Web3, key_prefix: str, s
                 st.markdown(f"[View on Arcscan]({explorer_url})", help="Opens Arcscan for the transaction")
                 with st.spinner("Waiting for receipt…"):
                     try:
-                        receipt = w3.eth.wait_for_transaction_receipt(tx_hash)
+                        receipt = _cached_receipt(str(w3.provider.endpoint_uri), str(tx_hash))
                         st.caption("Transaction receipt")
-                        st.json(
-                            {
-                                "transactionHash": receipt.get("transactionHash").hex()
-                                if receipt.get("transactionHash")
-                                else tx_hash,
-                                "status": receipt.get("status"),
-                                "blockNumber": receipt.get("blockNumber"),
-                                "gasUsed": receipt.get("gasUsed"),
-                                "cumulativeGasUsed": receipt.get("cumulativeGasUsed"),
-                            }
-                        )
+                        st.json(receipt)
                     except Exception as exc:
                         st.warning(f"Unable to fetch receipt yet: {exc}")
 
@@ -280,8 +329,8 @@ def render_wallet_section(mm_state: Dict[str, Any], w3: Web3, key_prefix: str, s
         st.write(component_value)
 
     if st.button("Clear MetaMask state", key=f"clear_mm_{key_prefix}_{selected}"):
-        st.session_state.pop(f"mm_state_{key_prefix}_{selected}", None)
-        st_rerun()
+        st.session_state.pop(state_key, None)
+        st_rerun()  # full rerun: the tool runner around this fragment must re-render its form
 
     if not chain_mismatch and mm_state.get("_auto_switch_attempted"):
         mm_state["_auto_switch_attempted"] = False
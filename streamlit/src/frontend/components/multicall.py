@@ -0,0 +1,120 @@
+"""Multicall3 helpers for batching read-only contract calls into one eth_call."""
+from __future__ import annotations
+
+import os
+from typing import Any, Optional, Sequence, Tuple
+
+from eth_abi import decode, encode
+from eth_utils.abi import get_abi_output_types
+from web3 import Web3
+from web3._utils.abi import map_abi_data
+from web3._utils.normalizers import BASE_RETURN_NORMALIZERS
+
+from .config import MULTICALL3_ADDRESS_ENV
+from .web3_utils import checksum_address, endpoint_key
+
+# Canonical deterministic-deployment address used on most EVM chains.
+DEFAULT_MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+_AGGREGATE3_SELECTOR = Web3.keccak(text="aggregate3((address,bool,bytes)[])")[:4]
+_GET_ETH_BALANCE_SELECTOR = Web3.keccak(text="getEthBalance(address)")[:4]
+
+# Endpoints where the aggregator call failed (e.g. contract not deployed); skip straight to serial calls.
+_UNSUPPORTED_ENDPOINTS: set[str] = set()
+
+
+def get_multicall_address() -> str:
+    """Return the Multicall3 address, honouring the optional env override."""
+    return os.getenv(MULTICALL3_ADDRESS_ENV) or DEFAULT_MULTICALL3_ADDRESS
+
+
+def eth_balance_call(account: str, multicall_address: Optional[str] = None) -> Tuple[str, bytes]:
+    """Build a ``(target, calldata)`` pair reading the native balance via ``Multicall3.getEthBalance``."""
+    target = checksum_address(multicall_address or get_multicall_address())
+    return target, _GET_ETH_BALANCE_SELECTOR + encode(["address"], [checksum_address(account)])
+
+
+def contract_call(fn: Any) -> Tuple[str, bytes]:
+    """Build a ``(target, calldata)`` pair from a bound ``ContractFunction`` (e.g. ``c.functions.x(a)``)."""
+    return fn.address, Web3.to_bytes(hexstr=fn._encode_transaction_data())
+
+
+def decode_call_result(fn: Any, data: bytes) -> Any:
+    """Decode raw return data the same way ``ContractFunction.call()`` would."""
+    output_types = get_abi_output_types(fn.abi)
+    normalized = map_abi_data(BASE_RETURN_NORMALIZERS, output_types, decode(output_types, data))
+    if len(normalized) == 1:
+        return normalized[0]
+    return normalized
+
+
+def multicall_supported(w3: Web3) -> bool:
+    """Return False once the aggregator has been found missing on ``w3``'s endpoint."""
+    return endpoint_key(w3) not in _UNSUPPORTED_ENDPOINTS
+
+
+def _json_rpc_batch(w3: Web3, calls: Sequence[Tuple[str, bytes]]) -> Optional[list[Optional[bytes]]]:
+    """Send the eth_calls as one JSON-RPC array request, or return None to fall back to serial calls.
+
+    A revert in any member fails the whole batch in web3, so callers retry call-by-call to
+    isolate it. Providers without ``batch_requests`` (web3 < 6) skip straight to serial calls.
+    """
+    if len(calls) < 2 or not hasattr(w3, "batch_requests"):
+        return None
+    try:
+        with w3.batch_requests() as batch:
+            for addr, data in calls:
+                batch.add(w3.eth.call({"to": checksum_address(addr), "data": bytes(data)}))
+            responses = batch.execute()
+    except OSError:
+        raise
+    except Exception:
+        return None
+    return [bytes(response) for response in responses]
+
+
+def batch_calls(
+    w3: Web3,
+    calls: Sequence[Tuple[str, bytes]],
+    *,
+    multicall_address: Optional[str] = None,
+) -> list[Optional[bytes]]:
+    """Execute ``(address, calldata)`` pairs via ``Multicall3.aggregate3`` in a single eth_call.
+
+    Returns the raw return data per call, or None for calls that reverted. When the aggregator is
+    unavailable on the connected chain the calls go out as one JSON-RPC batch, then one by one.
+    """
+    if not calls:
+        return []
+    endpoint = endpoint_key(w3)
+    if endpoint not in _UNSUPPORTED_ENDPOINTS:
+        target = checksum_address(multicall_address or get_multicall_address())
+        # Call3 tuples with allowFailure=true: one EVM call, per-call success flags in the result.
+        payload = _AGGREGATE3_SELECTOR + encode(
+            ["(address,bool,bytes)[]"],
+            [[(checksum_address(addr), True, bytes(data)) for addr, data in calls]],
+        )
+        try:
+            raw = bytes(w3.eth.call({"to": target, "data": payload}))
+        except OSError:
+            raise  # transport failure (e.g. requests.ConnectionError); retrying per call would not help
+        except Exception:
+            raw = None
+        if raw:
+            (results,) = decode(["(bool,bytes)[]"], raw)
+            return [bytes(data) if ok else None for ok, data in results]
+        if raw is not None:
+            # Empty return data means no aggregator is deployed at the target address.
+            _UNSUPPORTED_ENDPOINTS.add(endpoint)
+
+    batched = _json_rpc_batch(w3, calls)
+    if batched is not None:
+        return batched
+
+    outputs: list[Optional[bytes]] = []
+    for addr, data in calls:
+        try:
+            outputs.append(bytes(w3.eth.call({"to": checksum_address(addr), "data": bytes(data)})))
+        except Exception:
+            outputs.append(None)
+    return outputs
@@ -13,8 +13,12 @@ from .toolkit_lib.sbt_tools import build_llm_toolkit, build_sbt_guard
 from .toolkit_lib.pool_tools import build_lending_pool_toolkit
 from .toolkit_lib.bridge_tools import build_bridge_toolkit
 from .toolkit_lib.tx_helpers import (
+    build_base_tx,
     fee_params,
+    fee_params_from_block,
     next_nonce,
+    pending_nonce,
+    poll_receipt,
     sign_and_send,
     format_receipt,
     metamask_tx_request,
@@ -29,8 +33,12 @@ __all__ = [
     "build_sbt_guard",
     "build_lending_pool_toolkit",
     "build_bridge_toolkit",
+    "build_base_tx",
     "fee_params",
+    "fee_params_from_block",
     "next_nonce",
+    "pending_nonce",
+    "poll_receipt",
     "sign_and_send",
     "format_receipt",
     "metamask_tx_request",
@@ -27,6 +27,7 @@ from ..config import (
 )
 from ..toolkit_lib.config_utils import resolve_lending_pool_abi_path
 from ..toolkit_lib.messages import tool_error, tool_success
+from ..toolkit_lib.schemas import NO_ARGS_SCHEMA, ARC_TRANSFER_SCHEMA, START_BRIDGE_SCHEMA
 from ..mcp_lib.constants import (
     MCP_ARC_TRANSFER_SESSION_KEY,
     MCP_BRIDGE_SESSION_KEY,
@@ -157,14 +158,7 @@ def build_bridge_toolkit() -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
     register(
         "arcTransfer",
         "Send USDC from the LendingPool owner wallet to an ARC recipient.",
-        {
-            "type": "object",
-            "properties": {
-                "arc_recipient": {"type": "string", "description": "ARC recipient wallet address."},
-                "amount": {"type": "string", "description": "Amount of USDC to transfer (e.g., 0.10)."},
-            },
-            "required": ["arc_recipient", "amount"],
-        },
+        ARC_TRANSFER_SCHEMA,
         arc_transfer_tool,
     )
 
@@ -177,7 +171,7 @@ def build_bridge_toolkit() -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
     register(
         "getArcTransferState",
         "Return the last ARC same-chain transfer state if available.",
-        {"type": "object", "properties": {}, "required": []},
+        NO_ARGS_SCHEMA,
         lambda: get_arc_transfer_state_tool(),
     )
 
@@ -188,7 +182,7 @@ def build_bridge_toolkit() -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
     register(
         "clearArcTransferState",
         "Clear the stored ARC same-chain transfer session.",
-        {"type": "object", "properties": {}, "required": []},
+        NO_ARGS_SCHEMA,
         lambda: clear_arc_transfer_tool(),
     )
 
@@ -233,19 +227,7 @@ def build_bridge_toolkit() -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
     register(
         "startArcPolygonBridge",
         "Start the ARC → Polygon Circle CCTP bridge.",
-        {
-            "type": "object",
-            "properties": {
-                "polygon_address": {"type": "string", "description": "Destination Polygon wallet address."},
-                "amount": {"type": "string", "description": "Amount of USDC to bridge (e.g., 0.10)."},
-                "wait_for_attestation": {
-                    "type": "boolean",
-                    "description": "If true, wait for Circle attestation before returning.",
-                    "default": False,
-                },
-            },
-            "required": ["polygon_address", "amount"],
-        },
+        START_BRIDGE_SCHEMA,
         start_bridge_tool,
     )
 
@@ -258,7 +240,7 @@ def build_bridge_toolkit() -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
     register(
         "getBridgeState",
         "Return the current Circle CCTP bridge session state.",
-        {"type": "object", "properties": {}, "required": []},
+        NO_ARGS_SCHEMA,
         lambda: get_bridge_state_tool(),
     )
 
@@ -322,7 +304,7 @@ def build_bridge_toolkit() -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
     register(
         "resumeArcPolygonBridge",
         "Resume Circle attestation polling for an existing bridge session.",
-        {"type": "object", "properties": {}, "required": []},
+        NO_ARGS_SCHEMA,
         lambda: resume_bridge_tool(),
     )
 
@@ -359,7 +341,7 @@ def build_bridge_toolkit() -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
     register(
         "preparePolygonMint",
         "Prepare a MetaMask transaction request to mint bridged USDC on Polygon.",
-        {"type": "object", "properties": {}, "required": []},
+        NO_ARGS_SCHEMA,
         lambda: prepare_polygon_mint_tool(),
     )
 
@@ -373,7 +355,7 @@ def build_bridge_toolkit() -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
     register(
         "clearBridgeState",
         "Clear stored Circle CCTP bridge session data.",
-        {"type": "object", "properties": {}, "required": []},
+        NO_ARGS_SCHEMA,
         lambda: clear_bridge_state_tool(),
     )
 
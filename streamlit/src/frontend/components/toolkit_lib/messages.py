@@ -2,24 +2,41 @@ from __future__ import annotations
 
 import json
 import os
-from decimal import Decimal
 from typing import Any, Dict
 
 import streamlit as st
+from web3 import Web3
+
+try:  # optional: faster encoder for the tool payloads every handler returns
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None  # type: ignore[assignment]
 
 
 def tool_success(payload: Dict[str, Any]) -> str:
-    return json.dumps({"success": True, **payload}, default=_json_default)
+    return _dumps({"success": True, **payload})
 
 
 def tool_error(message: str, **extras: Any) -> str:
-    return json.dumps({"success": False, "error": message, **extras}, default=_json_default)
+    return _dumps({"success": False, "error": message, **extras})
 
 
 def _json_default(value: Any) -> Any:
-    if isinstance(value, Decimal):
-        return str(value)
-    return value
+    # HexBytes/bytes from web3 receipts as 0x-hex; Decimal amounts and anything else as str.
+    if isinstance(value, (bytes, bytearray)):
+        return Web3.to_hex(value)
+    return str(value)
+
+
+def _dumps(payload: Dict[str, Any]) -> str:
+    # Compact separators and raw UTF-8 in both branches, so output matches orjson's.
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload, default=_json_default).decode()
+        except TypeError:
+            # orjson rejects ints beyond 64 bits (wei amounts can exceed that) and non-str keys.
+            pass
+    return json.dumps(payload, default=_json_default, separators=(",", ":"), ensure_ascii=False)
 
 
 def render_tool_message(tool_name: str, content: str) -> None:
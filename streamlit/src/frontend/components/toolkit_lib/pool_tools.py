@@ -1,17 +1,39 @@
 from __future__ import annotations
 
 import os
+import time
+from concurrent.futures import Future
 from decimal import Decimal
-from typing import Any, Callable, Dict, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
 
 from web3 import Web3
 from web3.contract import Contract
-from web3.exceptions import ContractLogicError, BadFunctionCallOutput
+from web3.exceptions import ABIFunctionNotFound, ContractLogicError, BadFunctionCallOutput
 
 from .messages import tool_success, tool_error
-from .tx_helpers import fee_params, next_nonce, sign_and_send, metamask_tx_request
+from .schemas import (
+    NO_ARGS_SCHEMA,
+    LENDER_ADDRESS_SCHEMA,
+    BORROWER_ADDRESS_SCHEMA,
+    DEPOSIT_SCHEMA,
+    WITHDRAW_SCHEMA,
+    OPEN_LOAN_SCHEMA,
+    UNBAN_BATCH_SCHEMA,
+)
+from .tx_helpers import (
+    build_base_tx,
+    fee_params,
+    fee_params_from_block,
+    next_nonce,
+    pending_nonce,
+    sign_and_send,
+    metamask_tx_request,
+)
 
 from ..config import PRIVATE_KEY_ENV
+from ..multicall import batch_calls, contract_call, decode_call_result
+from ..web3_utils import checksum_address, endpoint_key, rpc_executor
 
 
 _LOAN_STATE_LABELS: Dict[int, str] = {
@@ -21,6 +43,56 @@ _LOAN_STATE_LABELS: Dict[int, str] = {
     3: "Defaulted",
 }
 
+# Fee quotes barely move within a few seconds; share them across toolkit rebuilds (one per rerun).
+_FEE_TTL_SECONDS = 2.0
+_FEE_CACHE: Dict[Tuple[str, str], Tuple[float, Dict[str, int]]] = {}
+
+
+def _make_tool_spec(name: str, description: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
+    return {"type": "function", "function": {"name": name, "description": description, "parameters": parameters}}
+
+
+_TOOL_SPECS: Mapping[str, Dict[str, Any]] = MappingProxyType(
+    {
+        spec["function"]["name"]: spec
+        for spec in (
+            _make_tool_spec("availableLiquidity", "Read pool's available liquidity (token balance).", NO_ARGS_SCHEMA),
+            _make_tool_spec(
+                "lenderBalance", "Read net balance (deposits - withdrawals) for a lender.", LENDER_ADDRESS_SCHEMA
+            ),
+            _make_tool_spec(
+                "lenderStatus", "Read aggregated lender metrics (deposited, withdrawn, unlockable).", LENDER_ADDRESS_SCHEMA
+            ),
+            _make_tool_spec(
+                "getLoan",
+                "Read loan struct for a borrower (principal, outstanding, startTime, dueTime, state).",
+                BORROWER_ADDRESS_SCHEMA,
+            ),
+            _make_tool_spec("isBanned", "Check if a borrower is banned due to default.", BORROWER_ADDRESS_SCHEMA),
+            _make_tool_spec("deposit", "Deposit USDC into the LendingPool (requires prior approve).", DEPOSIT_SCHEMA),
+            _make_tool_spec(
+                "withdraw", "Withdraw available USDC from the LendingPool (subject to liquidity/locks).", WITHDRAW_SCHEMA
+            ),
+            _make_tool_spec("openLoan", "Owner-only: open a loan for borrower and transfer principal.", OPEN_LOAN_SCHEMA),
+            _make_tool_spec("repay", "Borrower: repay outstanding loan balance (full payoff only).", NO_ARGS_SCHEMA),
+            _make_tool_spec(
+                "checkDefaultAndBan", "Anyone: check if borrower defaulted and ban if overdue.", BORROWER_ADDRESS_SCHEMA
+            ),
+            _make_tool_spec("unban", "Owner-only: unban a borrower after remedy.", BORROWER_ADDRESS_SCHEMA),
+            _make_tool_spec(
+                "unbanBatch", "Owner-only: unban several borrowers after remedy.", UNBAN_BATCH_SCHEMA
+            ),
+        )
+    }
+)
+
+
+def _missing_function(name: str) -> Callable[..., Any]:
+    def _raise(*_args: Any, **_kwargs: Any) -> Any:
+        raise ABIFunctionNotFound(f"The LendingPool ABI does not define '{name}'.")
+
+    return _raise
+
 
 def build_lending_pool_toolkit(
     *,
@@ -59,23 +131,62 @@ def build_lending_pool_toolkit(
     def _get_borrower_key() -> Optional[str]:
         return role_private_keys.get("Borrower")
     
-    def _get_owner_address() -> Optional[str]:
-        return role_addresses.get("Owner") or _acct_for_key(_get_owner_key())
-    
-    def _get_lender_address() -> Optional[str]:
-        return role_addresses.get("Lender") or _acct_for_key(_get_lender_key())
-    
-    def _get_borrower_address() -> Optional[str]:
-        return role_addresses.get("Borrower") or _acct_for_key(_get_borrower_key())
-    
     # Legacy variables for compatibility
     owner_key = _get_owner_key()
     lender_key = _get_lender_key()
     borrower_key = _get_borrower_key()
 
-    def register(name: str, description: str, parameters: Dict[str, Any], handler: Callable[..., str]) -> None:
-        tools.append({"type": "function", "function": {"name": name, "description": description, "parameters": parameters}})
-        handlers[name] = handler
+    # Keys are fixed for the toolkit's lifetime, so derive each signer address (ECDSA) once.
+    owner_signer = _acct_for_key(owner_key)
+    lender_signer = _acct_for_key(lender_key)
+    borrower_signer = _acct_for_key(borrower_key)
+
+    def _role_address(role: str, signer: Optional[str]) -> Optional[str]:
+        # Role assignments can change between calls, so look them up each time; the checksum is memoized.
+        addr = role_addresses.get(role)
+        if addr:
+            try:
+                return checksum_address(addr)
+            except ValueError:
+                return addr
+        return signer
+
+    def _get_owner_address() -> Optional[str]:
+        return _role_address("Owner", owner_signer)
+    
+    def _get_lender_address() -> Optional[str]:
+        return _role_address("Lender", lender_signer)
+    
+    def _get_borrower_address() -> Optional[str]:
+        return _role_address("Borrower", borrower_signer)
+
+    # Bind ContractFunction factories once; missing required entries raise when used, as before.
+    functions = pool_contract.functions
+    fn_loan_status = getattr(functions, "loanStatus", None)
+    fn_lender_status = getattr(functions, "lenderStatus", None)
+    fn_can_open_loan = getattr(functions, "canOpenLoan", None)
+
+    def _bind(name: str) -> Any:
+        return getattr(functions, name, None) or _missing_function(name)
+
+    fn_available = _bind("availableLiquidity")
+    fn_get_loan = _bind("getLoan")
+    fn_is_banned = _bind("isBanned")
+    fn_total_deposited = _bind("totalDeposited")
+    fn_total_withdrawn = _bind("totalWithdrawn")
+    fn_lender_balance = _bind("lenderBalance")
+    fn_preview_withdraw = _bind("previewWithdraw")
+    fn_deposit = _bind("deposit")
+    fn_withdraw = _bind("withdraw")
+    fn_open_loan = _bind("openLoan")
+    fn_repay = _bind("repay")
+    fn_check_default = _bind("checkDefaultAndBan")
+    fn_unban = _bind("unban")
+    fn_unban_batch = getattr(functions, "unbanBatch", None)
+
+    def register(tool_spec: Dict[str, Any], handler: Callable[..., str]) -> None:
+        tools.append(tool_spec)
+        handlers[tool_spec["function"]["name"]] = handler
 
     def _metamask_success(tx_req: Dict[str, Any], hint: str, from_addr: Optional[str]) -> str:
         payload: Dict[str, Any] = {
@@ -90,92 +201,151 @@ def build_lending_pool_toolkit(
             payload["metamask"]["from"] = from_addr
         return tool_success(payload)
 
+    fee_key = (endpoint_key(w3), str(gas_price_gwei))
+
+    def _cached_fees() -> Optional[Dict[str, int]]:
+        cached = _FEE_CACHE.get(fee_key)
+        if cached is not None and time.monotonic() - cached[0] < _FEE_TTL_SECONDS:
+            return dict(cached[1])
+        return None
+
+    def _store_fees(fees: Dict[str, int]) -> Dict[str, int]:
+        _FEE_CACHE[fee_key] = (time.monotonic(), fees)
+        return dict(fees)
+
     def _fees() -> Dict[str, int]:
-        return fee_params(w3, gas_price_gwei)
+        cached = _cached_fees()
+        return cached if cached is not None else _store_fees(fee_params(w3, gas_price_gwei))
 
-    def _to_token_units(amount: float | int, *, use_native: bool = False) -> int:
+    token_scale = 10 ** int(token_decimals)
+    native_scale = 10 ** int(native_decimals)
+
+    def _to_token_units(amount: Decimal | float | int, *, use_native: bool = False) -> int:
+        scale = native_scale if use_native else token_scale
         try:
-            amt = Decimal(str(amount))
-            scale = Decimal(10) ** int(native_decimals if use_native else token_decimals)
-            return int(amt * scale)
+            if isinstance(amount, int):
+                return amount * scale
+            if isinstance(amount, float) and amount.is_integer():
+                return int(amount) * scale
+            if isinstance(amount, Decimal):
+                return int(amount * scale)
+            # Fractional floats and strings go through their decimal text so 18-decimal amounts stay exact.
+            return int(Decimal(str(amount)) * scale)
         except Exception:
             return int(amount)
 
-    def _from_token_units(amount: int, *, use_native: bool = False) -> Decimal:
-        scale = Decimal(10) ** int(native_decimals if use_native else token_decimals)
-        return (Decimal(amount) / scale) if amount else Decimal(0)
+    def _format_units(amount: int, *, use_native: bool = False) -> str:
+        """Render base units as a human decimal string using integer math only."""
+        amount = int(amount)
+        if amount == 0:
+            return "0"
+        whole, frac = divmod(amount, native_scale if use_native else token_scale)
+        if frac == 0:
+            # Whole-token amounts (and zero-decimal tokens) need no fractional formatting.
+            return str(whole)
+        decimals = int(native_decimals if use_native else token_decimals)
+        return f"{whole}.{frac:0{decimals}d}".rstrip("0")
 
     def _normalize_reason(reason: str) -> str:
         return str(reason or "").replace("_", " ").lower()
 
+    def _batch_read(*fns: Any) -> list[Any]:
+        """Run several bound view calls in one Multicall3 round-trip and decode each result."""
+        results = batch_calls(w3, [contract_call(fn) for fn in fns])
+        decoded: list[Any] = []
+        for fn, raw in zip(fns, results):
+            if raw is None:
+                raise ContractLogicError(f"{fn.fn_name} reverted")
+            decoded.append(decode_call_result(fn, raw))
+        return decoded
+
+    def _read_loan(address: str, *extra: Any) -> tuple[Optional[tuple[int, int, int, int, int, bool]], list[Any]]:
+        """Read a borrower's loan status plus any ``extra`` bound view calls in one round-trip."""
+        if fn_loan_status is not None:
+            raw, *rest = _batch_read(fn_loan_status(address), *extra)
+            if isinstance(raw, (tuple, list)) and len(raw) == 6:
+                return (
+                    int(raw[0]),
+                    int(raw[1]),
+                    int(raw[2]),
+                    int(raw[3]),
+                    int(raw[4]),
+                    bool(raw[5]),
+                ), rest
+        loan, banned, *rest = _batch_read(
+            fn_get_loan(address),
+            fn_is_banned(address),
+            *extra,
+        )
+        if isinstance(loan, tuple) and len(loan) == 5:
+            principal, outstanding, start_time, due_time, state_or_flag = loan
+            state_code = int(state_or_flag)
+            banned_flag = bool(banned)
+            return (
+                state_code,
+                int(principal),
+                int(outstanding),
+                int(start_time),
+                int(due_time),
+                banned_flag,
+            ), rest
+        return None, rest
+
     def _loan_status(address: str) -> Optional[tuple[int, int, int, int, int, bool]]:
         try:
-            status_fn = getattr(pool_contract.functions, "loanStatus", None)
-            if status_fn is not None:
-                raw = status_fn(address).call()
-                if isinstance(raw, tuple) and len(raw) == 6:
-                    return (
-                        int(raw[0]),
-                        int(raw[1]),
-                        int(raw[2]),
-                        int(raw[3]),
-                        int(raw[4]),
-                        bool(raw[5]),
-                    )
-            loan = getattr(pool_contract.functions, "getLoan")(address).call()
-            if isinstance(loan, tuple) and len(loan) == 5:
-                principal, outstanding, start_time, due_time, state_or_flag = loan
-                state_code = int(state_or_flag)
-                banned_flag = bool(getattr(pool_contract.functions, "isBanned")(address).call())
-                return (
-                    state_code,
-                    int(principal),
-                    int(outstanding),
-                    int(start_time),
-                    int(due_time),
-                    banned_flag,
-                )
+            return _read_loan(address)[0]
         except Exception:
             return None
 
     def _lender_status(address: str) -> Optional[tuple[int, int, int, int]]:
         try:
-            status_fn = getattr(pool_contract.functions, "lenderStatus", None)
-            if status_fn is not None:
-                return status_fn(address).call()
-            total_dep = int(getattr(pool_contract.functions, "totalDeposited")(address).call())
-            total_withdrawn = int(getattr(pool_contract.functions, "totalWithdrawn")(address).call())
-            balance = int(getattr(pool_contract.functions, "lenderBalance")(address).call())
-            unlockable = int(getattr(pool_contract.functions, "previewWithdraw")(address).call())
+            if fn_lender_status is not None:
+                return fn_lender_status(address).call()
+            total_dep, total_withdrawn, balance, unlockable = map(
+                int,
+                _batch_read(
+                    fn_total_deposited(address),
+                    fn_total_withdrawn(address),
+                    fn_lender_balance(address),
+                    fn_preview_withdraw(address),
+                ),
+            )
             return total_dep, total_withdrawn, balance, unlockable
         except Exception:
             return None
 
-    def _manual_can_open_loan(address: str, principal_units: int) -> tuple[bool, str]:
-        loan = _loan_status(address)
+    def _manual_can_open_loan(
+        address: str, principal_units: int
+    ) -> tuple[bool, str, Optional[tuple[int, int, int, int, int, bool]]]:
+        try:
+            # Liquidity rides along with the loan reads so the precheck costs one round-trip.
+            loan, (available,) = _read_loan(address, fn_available())
+        except Exception:
+            loan, available = _loan_status(address), None
         if loan is None:
-            return False, "Unable to read loan status"
+            return False, "Unable to read loan status", None
         state_code, _, outstanding, _, _, banned_flag = loan
         if banned_flag:
-            return False, "Borrower is banned"
+            return False, "Borrower is banned", loan
         if state_code == 1 and outstanding != 0:
-            human = _from_token_units(outstanding, use_native=True)
-            return False, f"Borrower has an active loan outstanding ({human} units)"
-        try:
-            available = int(getattr(pool_contract.functions, "availableLiquidity")().call())
-        except Exception:
-            return False, "Unable to read pool liquidity"
+            human = _format_units(outstanding, use_native=True)
+            return False, f"Borrower has an active loan outstanding ({human} units)", loan
+        if available is None:
+            return False, "Unable to read pool liquidity", loan
+        available = int(available)
         if available < principal_units:
-            return False, "Insufficient pool liquidity"
-        return True, "OK"
+            return False, "Insufficient pool liquidity", loan
+        return True, "OK", loan
 
-    def _can_open_loan(address: str, principal_units: int) -> tuple[bool, str]:
+    def _can_open_loan(
+        address: str, principal_units: int
+    ) -> tuple[bool, str, Optional[tuple[int, int, int, int, int, bool]]]:
+        """Return ``(ok, reason, loan_status)``; the status is None when the on-chain checker answered."""
         try:
-            checker = getattr(pool_contract.functions, "canOpenLoan", None)
-            if checker is None:
+            if fn_can_open_loan is None:
                 return _manual_can_open_loan(address, principal_units)
             try:
-                ok, reason = checker(address, principal_units).call()
+                ok, reason = fn_can_open_loan(address, principal_units).call()
             except (ContractLogicError, BadFunctionCallOutput):
                 return _manual_can_open_loan(address, principal_units)
             if isinstance(reason, (bytes, bytearray)):
@@ -183,47 +353,33 @@ def build_lending_pool_toolkit(
                     reason = reason.decode("utf-8").rstrip("\x00")
                 except Exception:
                     reason = reason.hex()
-            return bool(ok), str(reason)
+            return bool(ok), str(reason), None
         except Exception as exc:
-            return False, f"Unable to evaluate loan conditions: {exc}"
+            return False, f"Unable to evaluate loan conditions: {exc}", None
 
     # ---- Views ----
     def availableLiquidity_tool() -> str:
         try:
-            amount = int(getattr(pool_contract.functions, "availableLiquidity")().call())
+            amount = int(fn_available().call())
             return tool_success({"availableLiquidity": amount})
         except Exception as exc:
             return tool_error(f"Read failed: {exc}")
 
-    register(
-        "availableLiquidity",
-        "Read pool's available liquidity (token balance).",
-        {"type": "object", "properties": {}, "required": []},
-        lambda: availableLiquidity_tool(),
-    )
+    register(_TOOL_SPECS["availableLiquidity"], availableLiquidity_tool)
 
     def lenderBalance_tool(lender_address: str) -> str:
         try:
-            lender = Web3.to_checksum_address(lender_address)
-            amount = int(getattr(pool_contract.functions, "lenderBalance")(lender).call())
+            lender = checksum_address(lender_address)
+            amount = int(fn_lender_balance(lender).call())
             return tool_success({"lender": lender, "balance": amount})
         except Exception as exc:
             return tool_error(f"Read failed: {exc}")
 
-    register(
-        "lenderBalance",
-        "Read net balance (deposits - withdrawals) for a lender.",
-        {
-            "type": "object",
-            "properties": {"lender_address": {"type": "string", "description": "Lender wallet address."}},
-            "required": ["lender_address"],
-        },
-        lenderBalance_tool,
-    )
+    register(_TOOL_SPECS["lenderBalance"], lenderBalance_tool)
 
     def lenderStatus_tool(lender_address: str) -> str:
         try:
-            lender = Web3.to_checksum_address(lender_address)
+            lender = checksum_address(lender_address)
         except ValueError:
             return tool_error("Invalid lender address supplied.")
         status = _lender_status(lender)
@@ -236,26 +392,17 @@ def build_lending_pool_toolkit(
                 "totalDeposited": total_dep,
                 "totalWithdrawn": total_withdrawn,
                 "currentBalance": balance,
-                "currentBalanceHuman": str(_from_token_units(balance, use_native=True)),
+                "currentBalanceHuman": _format_units(balance, use_native=True),
                 "unlockable": unlockable,
-                "unlockableHuman": str(_from_token_units(unlockable, use_native=True)),
+                "unlockableHuman": _format_units(unlockable, use_native=True),
             }
         )
 
-    register(
-        "lenderStatus",
-        "Read aggregated lender metrics (deposited, withdrawn, unlockable).",
-        {
-            "type": "object",
-            "properties": {"lender_address": {"type": "string", "description": "Lender wallet address."}},
-            "required": ["lender_address"],
-        },
-        lenderStatus_tool,
-    )
+    register(_TOOL_SPECS["lenderStatus"], lenderStatus_tool)
 
     def getLoan_tool(borrower_address: str) -> str:
         try:
-            borrower = Web3.to_checksum_address(borrower_address)
+            borrower = checksum_address(borrower_address)
             status = _loan_status(borrower)
             if status is None:
                 return tool_error("Unable to read loan status for borrower.")
@@ -265,7 +412,7 @@ def build_lending_pool_toolkit(
                     "borrower": borrower,
                     "principal": int(principal),
                     "outstanding": int(outstanding),
-                    "outstandingHuman": str(_from_token_units(int(outstanding), use_native=True)),
+                    "outstandingHuman": _format_units(int(outstanding), use_native=True),
                     "startTime": int(start_time),
                     "dueTime": int(due_time),
                     "state": _LOAN_STATE_LABELS.get(state_code, f"Unknown({state_code})"),
@@ -276,37 +423,123 @@ def build_lending_pool_toolkit(
         except Exception as exc:
             return tool_error(f"Read failed: {exc}")
 
-    register(
-        "getLoan",
-        "Read loan struct for a borrower (principal, outstanding, startTime, dueTime, state).",
-        {
-            "type": "object",
-            "properties": {"borrower_address": {"type": "string", "description": "Borrower wallet address."}},
-            "required": ["borrower_address"],
-        },
-        getLoan_tool,
-    )
+    register(_TOOL_SPECS["getLoan"], getLoan_tool)
 
     def isBanned_tool(borrower_address: str) -> str:
         try:
-            borrower = Web3.to_checksum_address(borrower_address)
-            banned = bool(getattr(pool_contract.functions, "isBanned")(borrower).call())
+            borrower = checksum_address(borrower_address)
+            banned = bool(fn_is_banned(borrower).call())
             return tool_success({"borrower": borrower, "banned": banned})
         except Exception as exc:
             return tool_error(f"Read failed: {exc}")
 
-    register(
-        "isBanned",
-        "Check if a borrower is banned due to default.",
-        {
-            "type": "object",
-            "properties": {"borrower_address": {"type": "string", "description": "Borrower wallet address."}},
-            "required": ["borrower_address"],
-        },
-        isBanned_tool,
-    )
+    register(_TOOL_SPECS["isBanned"], isBanned_tool)
 
     # ---- Writes ----
+    role_signers: Dict[str, Tuple[Optional[str], Optional[str]]] = {
+        "Owner": (owner_key, owner_signer),
+        "Lender": (lender_key, lender_signer),
+        "Borrower": (borrower_key, borrower_signer),
+    }
+    wallet_not_configured = {
+        "Owner": "Owner wallet not configured. Assign an owner address via MetaMask role assignment or set PRIVATE_KEY.",
+        "Lender": "Lender wallet not configured. Assign a lender address via MetaMask role assignment or set LENDER_PRIVATE_KEY.",
+        "Borrower": "Borrower wallet not configured. Assign a borrower address via MetaMask role assignment or set BORROWER_PRIVATE_KEY.",
+    }
+
+    # Rolling nonce per signer for this toolkit build: only the first write asks the node.
+    nonce_cache: Dict[str, int] = {}
+
+    def _nonce(signer: str, pending: Optional[int] = None) -> int:
+        # The rolling value stands in for the node's pending count, but still goes through
+        # next_nonce so the session key it shares with the SBT tools (same owner key) stays the
+        # single source of truth: a nonce consumed there is never reused here.
+        cached = nonce_cache.get(signer)
+        return next_nonce(w3, signer, cached if cached is not None else pending)
+
+    def _track_nonce(signer: str, nonce: int, sent: Dict[str, Any]) -> None:
+        error = str(sent.get("error") or "").lower()
+        broadcast = "txHash" in sent and sent.get("status") != "underpriced"
+        if broadcast and not any(marker in error for marker in ("nonce", "replacement", "underpriced")):
+            nonce_cache[signer] = nonce + 1
+        else:
+            # Never reached the mempool (or the node disputes the nonce): resync on the next write.
+            nonce_cache.pop(signer, None)
+
+    def _prep_tx_context(signer: str) -> Tuple[Optional[int], Dict[str, int]]:
+        """Return ``(pending_count, fees)``, fetching whatever is not cached in one JSON-RPC batch.
+
+        ``pending_count`` is None when the rolling nonce already covers ``signer``. Only the raw
+        count is read here (this may run off the script thread); ``_nonce`` applies the session bump.
+        """
+        fees = _cached_fees()
+        need_nonce = signer not in nonce_cache
+        if fees is not None:
+            return (pending_nonce(w3, signer) if need_nonce else None), fees
+        if need_nonce and hasattr(w3, "batch_requests"):
+            try:
+                with w3.batch_requests() as batch:
+                    batch.add(w3.eth.get_transaction_count(signer, "pending"))
+                    batch.add(w3.eth.get_block("latest"))
+                    pending, latest = batch.execute()
+                return int(pending), _store_fees(fee_params_from_block(latest, gas_price_gwei))
+            except OSError:
+                raise
+            except Exception:
+                pass  # a failed member fails the whole batch; fall back to separate calls
+        return (pending_nonce(w3, signer) if need_nonce else None), _fees()
+
+    def _prefetch_tx_context(role: str) -> Optional[Future]:
+        # Starts the nonce/fee reads while the caller runs its prechecks; a rejected call burns no nonce.
+        signer_key, signer = role_signers[role]
+        if not (signer and signer_key):
+            return None
+        return rpc_executor().submit(_prep_tx_context, signer)
+
+    def _exec_write(
+        fn: Callable[..., Any],
+        fn_name: str,
+        args: list[Any],
+        *,
+        role: str,
+        hint: str,
+        value_wei: int = 0,
+        gas: Optional[int] = None,
+        prefetched: Optional[Future] = None,
+        on_sent: Optional[Callable[[Dict[str, Any]], str]] = None,
+    ) -> str:
+        """Sign with the role's env key when configured, otherwise hand a tx request to MetaMask."""
+        signer_key, signer = role_signers[role]
+        if signer and signer_key:
+            try:
+                pending, fees = prefetched.result() if prefetched is not None else _prep_tx_context(signer)
+                nonce = _nonce(signer, pending)
+                tx = fn(*args).build_transaction(
+                    build_base_tx(signer, nonce, fees, w3.eth.chain_id, gas or default_gas_limit, value_wei)
+                )
+                sent = sign_and_send(w3, signer_key, tx)
+                _track_nonce(signer, nonce, sent)
+                if on_sent is not None:
+                    return on_sent(sent)
+                err = sent.get("error")
+                return tool_error(err or f"{fn_name} failed") if err is not None else tool_success(sent)
+            except ContractLogicError as exc:
+                return tool_error(f"Contract rejected: {exc}")
+            except Exception as exc:
+                return tool_error(f"{fn_name} failed: {exc}")
+
+        role_addr = _role_address(role, signer)
+        if role_addr:
+            try:
+                tx_req = metamask_tx_request(pool_contract, fn_name, args, value_wei=value_wei, from_address=role_addr)
+                if gas:
+                    tx_req["gas"] = hex(gas)
+                return _metamask_success(tx_req, hint, role_addr)
+            except Exception as exc:
+                return tool_error(f"Unable to build MetaMask tx: {exc}")
+
+        return tool_error(wallet_not_configured[role])
+
     def deposit_tool(amount: float | int) -> str:
         try:
             amt_decimal = Decimal(str(amount))
@@ -319,58 +552,16 @@ def build_lending_pool_toolkit(
         except Exception as exc:
             return tool_error(f"Invalid amount: {exc}")
 
-        signer = _acct_for_key(lender_key)
-        if signer and lender_key:
-            try:
-                tx = pool_contract.functions.deposit(amt).build_transaction(
-                    {
-                        "from": signer,
-                        "nonce": next_nonce(w3, signer),
-                        "gas": default_gas_limit,
-                        "chainId": w3.eth.chain_id,
-                        "value": amt,
-                        **_fees(),
-                    }
-                )
-                sent = sign_and_send(w3, lender_key, tx)  # type: ignore[arg-type]
-                return tool_success(sent) if "error" not in sent else tool_error(sent.get("error", "deposit failed"))
-            except ContractLogicError as exc:
-                return tool_error(f"Contract rejected: {exc}")
-            except Exception as exc:
-                return tool_error(f"deposit failed: {exc}")
-
-        lender_addr = _get_lender_address()
-        if lender_addr:
-            try:
-                tx_req = metamask_tx_request(
-                    pool_contract,
-                    "deposit",
-                    [amt],
-                    value_wei=amt,
-                    from_address=lender_addr,
-                )
-                return _metamask_success(
-                    tx_req,
-                    "Use MetaMask (lender wallet) to deposit native USDC into the pool.",
-                    lender_addr,
-                )
-            except Exception as exc:
-                return tool_error(f"Unable to build MetaMask tx: {exc}")
-
-        return tool_error(
-            "Lender wallet not configured. Assign a lender address via MetaMask role assignment or set LENDER_PRIVATE_KEY."
+        return _exec_write(
+            fn_deposit,
+            "deposit",
+            [amt],
+            role="Lender",
+            hint="Use MetaMask (lender wallet) to deposit native USDC into the pool.",
+            value_wei=amt,
         )
 
-    register(
-        "deposit",
-        "Deposit USDC into the LendingPool (requires prior approve).",
-        {
-            "type": "object",
-            "properties": {"amount": {"type": "number", "description": "Amount in human units (e.g., 100 USDC)."}},
-            "required": ["amount"],
-        },
-        deposit_tool,
-    )
+    register(_TOOL_SPECS["deposit"], deposit_tool)
 
     def withdraw_tool(amount: float | int) -> str:
         try:
@@ -388,80 +579,38 @@ def build_lending_pool_toolkit(
         status_address: Optional[str] = None
         if lender_addr:
             try:
-                status_address = Web3.to_checksum_address(lender_addr)
+                status_address = checksum_address(lender_addr)
             except ValueError:
                 status_address = None
         if status_address is None:
-            signer = _acct_for_key(lender_key)
-            if signer:
-                try:
-                    status_address = Web3.to_checksum_address(signer)
-                except ValueError:
-                    status_address = None
+            status_address = lender_signer
+
+        prefetched = _prefetch_tx_context("Lender")
 
         if status_address:
             status = _lender_status(status_address)
             if status is not None:
                 _, _, _, unlockable = map(int, status)
                 if amt > unlockable:
-                    human_unlockable = _from_token_units(unlockable, use_native=True)
+                    human_unlockable = _format_units(unlockable, use_native=True)
                     return tool_error(
                         f"Requested withdrawal exceeds unlocked balance ({human_unlockable} available)."
                     )
 
-        signer = _acct_for_key(lender_key)
-        if signer and lender_key:
-            try:
-                tx = pool_contract.functions.withdraw(amt).build_transaction(
-                    {
-                        "from": signer,
-                        "nonce": next_nonce(w3, signer),
-                        "gas": default_gas_limit,
-                        "chainId": w3.eth.chain_id,
-                        **_fees(),
-                    }
-                )
-                sent = sign_and_send(w3, lender_key, tx)  # type: ignore[arg-type]
-                return tool_success(sent) if "error" not in sent else tool_error(sent.get("error", "withdraw failed"))
-            except ContractLogicError as exc:
-                return tool_error(f"Contract rejected: {exc}")
-            except Exception as exc:
-                return tool_error(f"withdraw failed: {exc}")
-
-        if lender_addr:
-            try:
-                tx_req = metamask_tx_request(
-                    pool_contract,
-                    "withdraw",
-                    [amt],
-                    from_address=lender_addr,
-                )
-                return _metamask_success(
-                    tx_req,
-                    "Use MetaMask (lender wallet) to withdraw unlocked funds.",
-                    lender_addr,
-                )
-            except Exception as exc:
-                return tool_error(f"Unable to build MetaMask tx: {exc}")
-
-        return tool_error(
-            "Lender wallet not configured. Assign a lender address via MetaMask role assignment or set LENDER_PRIVATE_KEY."
+        return _exec_write(
+            fn_withdraw,
+            "withdraw",
+            [amt],
+            role="Lender",
+            hint="Use MetaMask (lender wallet) to withdraw unlocked funds.",
+            prefetched=prefetched,
         )
 
-    register(
-        "withdraw",
-        "Withdraw available USDC from the LendingPool (subject to liquidity/locks).",
-        {
-            "type": "object",
-            "properties": {"amount": {"type": "number", "description": "Amount in human units."}},
-            "required": ["amount"],
-        },
-        withdraw_tool,
-    )
+    register(_TOOL_SPECS["withdraw"], withdraw_tool)
 
     def openLoan_tool(borrower_address: str, principal: float | int, term_seconds: int) -> str:
         try:
-            borrower = Web3.to_checksum_address(borrower_address)
+            borrower = checksum_address(borrower_address)
         except ValueError:
             return tool_error("Invalid borrower address supplied.")
         if borrower_guard:
@@ -479,14 +628,17 @@ def build_lending_pool_toolkit(
         except Exception as exc:
             return tool_error(f"Invalid principal: {exc}")
 
-        ok, reason = _can_open_loan(borrower, principal_units)
+        prefetched = _prefetch_tx_context("Owner")
+
+        ok, reason, status = _can_open_loan(borrower, principal_units)
         if not ok:
             normalized_reason = _normalize_reason(reason)
             if "active loan" in normalized_reason:
-                status = _loan_status(borrower)
+                if status is None:
+                    status = _loan_status(borrower)
                 if status is not None:
                     _, _, outstanding, _, _, _ = status
-                    human_outstanding = _from_token_units(int(outstanding), use_native=True)
+                    human_outstanding = _format_units(int(outstanding), use_native=True)
                     return tool_error(
                         f"Cannot open loan: borrower has an active loan outstanding ({human_outstanding} native units)."
                     )
@@ -494,8 +646,8 @@ def build_lending_pool_toolkit(
                 return tool_error("Cannot open loan: borrower is banned.")
             if "insufficient pool liquidity" in normalized_reason:
                 try:
-                    available = int(getattr(pool_contract.functions, "availableLiquidity")().call())
-                    human_available = _from_token_units(available, use_native=True)
+                    available = int(fn_available().call())
+                    human_available = _format_units(available, use_native=True)
                     return tool_error(f"Cannot open loan: only {human_available} native units are currently available in the pool.")
                 except Exception:
                     return tool_error("Cannot open loan: insufficient pool liquidity.")
@@ -512,80 +664,35 @@ def build_lending_pool_toolkit(
             human_readable_reason = normalized_reason.strip().capitalize() if normalized_reason else str(reason)
             return tool_error(f"Cannot open loan: {human_readable_reason}")
 
-        owner_pk = _get_owner_key()
-        signer = _acct_for_key(owner_pk)
-        if signer and owner_pk:
-            try:
-                fees = _fees()
-                nonce = next_nonce(w3, signer)
-                tx = pool_contract.functions.openLoan(borrower, principal_units, int(term_seconds)).build_transaction(
-                    {
-                        "from": signer,
-                        "nonce": nonce,
-                        "gas": max(default_gas_limit, 500000),  # openLoan needs ~500k gas
-                        "chainId": w3.eth.chain_id,
-                        **fees,
-                    }
-                )
-                sent = sign_and_send(w3, owner_pk, tx)  # type: ignore[arg-type]
-                if "error" in sent:
-                    reason = sent.get("reason")
-                    if reason:
-                        return tool_error(f"{sent['error']}: {reason}")
-                    detail = sent.get("error")
-                    if detail and detail.strip():
-                        return tool_error(detail)
-                    return tool_error(
-                        "Transaction reverted without a reason. Check that the owner wallet matches `Ownable.initialOwner` and that the borrower has no active loan, is not banned, and the pool has sufficient liquidity."
-                    )
-                return tool_success(sent)
-            except ContractLogicError as exc:
-                return tool_error(f"Contract rejected: {exc}")
-            except Exception as exc:
-                return tool_error(f"openLoan failed: {exc}")
-
-        owner_addr = _get_owner_address()
-        if owner_addr:
-            try:
-                tx_req = metamask_tx_request(
-                    pool_contract,
-                    "openLoan",
-                    [borrower, principal_units, int(term_seconds)],
-                    from_address=owner_addr,
+        def _open_loan_sent(sent: Dict[str, Any]) -> str:
+            err = sent.get("error")
+            if err is not None:
+                reason = sent.get("reason")
+                if reason:
+                    return tool_error(f"{err}: {reason}")
+                if err and err.strip():
+                    return tool_error(err)
+                return tool_error(
+                    "Transaction reverted without a reason. Check that the owner wallet matches `Ownable.initialOwner` and that the borrower has no active loan, is not banned, and the pool has sufficient liquidity."
                 )
-                # openLoan needs more gas due to SBT checks + native transfer
-                tx_req["gas"] = hex(500000)  # 500k gas limit
-                return _metamask_success(
-                    tx_req,
-                    "Use MetaMask (owner wallet) to open a loan.",
-                    owner_addr,
-                )
-            except Exception as exc:
-                return tool_error(f"Unable to build MetaMask tx: {exc}")
-
-        return tool_error(
-            "Owner wallet not configured. Assign an owner address via MetaMask role assignment or set PRIVATE_KEY."
+            return tool_success(sent)
+
+        return _exec_write(
+            fn_open_loan,
+            "openLoan",
+            [borrower, principal_units, int(term_seconds)],
+            role="Owner",
+            hint="Use MetaMask (owner wallet) to open a loan.",
+            gas=max(default_gas_limit, 500000),  # openLoan needs ~500k gas (SBT checks + native transfer)
+            prefetched=prefetched,
+            on_sent=_open_loan_sent,
         )
 
-    register(
-        "openLoan",
-        "Owner-only: open a loan for borrower and transfer principal.",
-        {
-            "type": "object",
-            "properties": {
-                "borrower_address": {"type": "string", "description": "Borrower wallet address."},
-                "principal": {"type": "number", "description": "Principal in human units (e.g., 50 USDC)."},
-                "term_seconds": {"type": "integer", "description": "Loan term in seconds (e.g., 604800 for 7 days)."},
-            },
-            "required": ["borrower_address", "principal", "term_seconds"],
-        },
-        openLoan_tool,
-    )
+    register(_TOOL_SPECS["openLoan"], openLoan_tool)
 
     def repay_tool() -> str:
         # Dynamically get borrower address (in case it was assigned after toolkit creation)
         borrower_addr = _get_borrower_address()
-        borrower_pk = _get_borrower_key()
         
         if not borrower_addr:
             return tool_error(
@@ -593,7 +700,7 @@ def build_lending_pool_toolkit(
             )
 
         try:
-            borrower = Web3.to_checksum_address(borrower_addr)
+            borrower = checksum_address(borrower_addr)
         except ValueError:
             return tool_error("Borrower address is not valid.")
 
@@ -607,179 +714,77 @@ def build_lending_pool_toolkit(
             return tool_error("No active loan to repay.")
 
         amt = int(outstanding)
-        amt_decimal = _from_token_units(amt, use_native=True)
-        hint = f"Repay outstanding balance ({amt_decimal} in native units)."
-
-        signer = _acct_for_key(borrower_pk)
-        if signer and borrower_pk:
-            try:
-                tx = pool_contract.functions.repay(amt).build_transaction(
-                    {
-                        "from": signer,
-                        "nonce": next_nonce(w3, signer),
-                        "gas": default_gas_limit,
-                        "chainId": w3.eth.chain_id,
-                        "value": amt,
-                        **_fees(),
-                    }
-                )
-                sent = sign_and_send(w3, borrower_pk, tx)  # type: ignore[arg-type]
-                if "error" in sent:
-                    return tool_error(sent.get("error", "repay failed"))
-                sent.setdefault("hint", hint)
-                return tool_success(sent)
-            except ContractLogicError as exc:
-                return tool_error(f"Contract rejected: {exc}")
-            except Exception as exc:
-                return tool_error(f"repay failed: {exc}")
+        amt_human = _format_units(amt, use_native=True)
+        hint = f"Repay outstanding balance ({amt_human} in native units)."
 
-        if borrower_addr:
-            try:
-                tx_req = metamask_tx_request(
-                    pool_contract,
-                    "repay",
-                    [amt],
-                    value_wei=amt,
-                    from_address=borrower_addr,
-                )
-                return _metamask_success(
-                    tx_req,
-                    hint,
-                    borrower_addr,
-                )
-            except Exception as exc:
-                return tool_error(f"Unable to build MetaMask tx: {exc}")
+        def _repay_sent(sent: Dict[str, Any]) -> str:
+            err = sent.get("error")
+            if err is not None:
+                return tool_error(err or "repay failed")
+            sent.setdefault("hint", hint)
+            return tool_success(sent)
 
-        return tool_error(
-            "Borrower wallet not configured. Assign a borrower address via MetaMask role assignment or set BORROWER_PRIVATE_KEY."
-        )
+        return _exec_write(fn_repay, "repay", [amt], role="Borrower", hint=hint, value_wei=amt, on_sent=_repay_sent)
 
-    register(
-        "repay",
-        "Borrower: repay outstanding loan balance (full payoff only).",
-        {
-            "type": "object",
-            "properties": {},
-            "required": [],
-        },
-        repay_tool,
-    )
+    register(_TOOL_SPECS["repay"], repay_tool)
 
     def checkDefaultAndBan_tool(borrower_address: str) -> str:
-        signer = _acct_for_key(owner_key)
         try:
-            borrower = Web3.to_checksum_address(borrower_address)
+            borrower = checksum_address(borrower_address)
         except ValueError:
             return tool_error("Invalid borrower address supplied.")
-        if signer and owner_key:
-            try:
-                fees = _fees()
-                nonce = next_nonce(w3, signer)
-                tx = pool_contract.functions.checkDefaultAndBan(borrower).build_transaction(
-                    {
-                        "from": signer,
-                        "nonce": nonce,
-                        "gas": default_gas_limit,
-                        "chainId": w3.eth.chain_id,
-                        **fees,
-                    }
-                )
-                sent = sign_and_send(w3, owner_pk, tx)  # type: ignore[arg-type]
-                return tool_success(sent) if "error" not in sent else tool_error(sent.get("error", "checkDefaultAndBan failed"))
-            except ContractLogicError as exc:
-                return tool_error(f"Contract rejected: {exc}")
-            except Exception as exc:
-                return tool_error(f"checkDefaultAndBan failed: {exc}")
-
-        owner_addr = _get_owner_address()
-        if owner_addr:
-            try:
-                tx_req = metamask_tx_request(
-                    pool_contract,
-                    "checkDefaultAndBan",
-                    [borrower],
-                    from_address=owner_addr,
-                )
-                return _metamask_success(
-                    tx_req,
-                    "Use MetaMask (owner wallet) to check default and ban overdue borrower.",
-                    owner_addr,
-                )
-            except Exception as exc:
-                return tool_error(f"Unable to build MetaMask tx: {exc}")
-
-        return tool_error(
-            "Owner wallet not configured. Assign an owner address via MetaMask role assignment or set PRIVATE_KEY."
+        return _exec_write(
+            fn_check_default,
+            "checkDefaultAndBan",
+            [borrower],
+            role="Owner",
+            hint="Use MetaMask (owner wallet) to check default and ban overdue borrower.",
         )
 
-    register(
-        "checkDefaultAndBan",
-        "Anyone: check if borrower defaulted and ban if overdue.",
-        {
-            "type": "object",
-            "properties": {"borrower_address": {"type": "string", "description": "Borrower wallet address."}},
-            "required": ["borrower_address"],
-        },
-        checkDefaultAndBan_tool,
-    )
+    register(_TOOL_SPECS["checkDefaultAndBan"], checkDefaultAndBan_tool)
 
     def unban_tool(borrower_address: str) -> str:
         try:
-            borrower = Web3.to_checksum_address(borrower_address)
+            borrower = checksum_address(borrower_address)
         except ValueError:
             return tool_error("Invalid borrower address supplied.")
 
-        owner_pk = _get_owner_key()
-        signer = _acct_for_key(owner_pk)
-        if signer and owner_pk:
-            try:
-                tx = pool_contract.functions.unban(borrower).build_transaction(
-                    {
-                        "from": signer,
-                        "nonce": next_nonce(w3, signer),
-                        "gas": default_gas_limit,
-                        "chainId": w3.eth.chain_id,
-                        **_fees(),
-                    }
-                )
-                sent = sign_and_send(w3, owner_pk, tx)  # type: ignore[arg-type]
-                return tool_success(sent) if "error" not in sent else tool_error(sent.get("error", "unban failed"))
-            except ContractLogicError as exc:
-                return tool_error(f"Contract rejected: {exc}")
-            except Exception as exc:
-                return tool_error(f"unban failed: {exc}")
+        return _exec_write(
+            fn_unban,
+            "unban",
+            [borrower],
+            role="Owner",
+            hint="Use MetaMask (owner wallet) to unban borrower after remedy.",
+        )
 
-        owner_addr = _get_owner_address()
-        if owner_addr:
-            try:
-                tx_req = metamask_tx_request(
-                    pool_contract,
-                    "unban",
-                    [borrower],
-                    from_address=owner_addr,
-                )
-                return _metamask_success(
-                    tx_req,
-                    "Use MetaMask (owner wallet) to unban borrower after remedy.",
-                    owner_addr,
-                )
-            except Exception as exc:
-                return tool_error(f"Unable to build MetaMask tx: {exc}")
+    register(_TOOL_SPECS["unban"], unban_tool)
+
+    if fn_unban_batch is None:
+        return tools, handlers
 
-        return tool_error(
-            "Owner wallet not configured. Assign an owner address via MetaMask role assignment or set PRIVATE_KEY."
+    def unbanBatch_tool(borrower_addresses: list[str]) -> str:
+        if isinstance(borrower_addresses, str):
+            borrower_addresses = [item for item in borrower_addresses.split(",") if item.strip()]
+        borrowers: list[str] = []
+        for raw in borrower_addresses or []:
+            try:
+                borrower = checksum_address(str(raw))
+            except ValueError:
+                return tool_error(f"Invalid borrower address supplied: {raw}")
+            if borrower not in borrowers:
+                borrowers.append(borrower)
+        if not borrowers:
+            return tool_error("Provide at least one borrower address.")
+
+        return _exec_write(
+            fn_unban_batch,
+            "unbanBatch",
+            [borrowers],
+            role="Owner",
+            hint="Use MetaMask (owner wallet) to unban borrowers after remedy.",
         )
 
-    register(
-        "unban",
-        "Owner-only: unban a borrower after remedy.",
-        {
-            "type": "object",
-            "properties": {"borrower_address": {"type": "string", "description": "Borrower wallet address."}},
-            "required": ["borrower_address"],
-        },
-        unban_tool,
-    )
+    register(_TOOL_SPECS["unbanBatch"], unbanBatch_tool)
 
     return tools, handlers
 
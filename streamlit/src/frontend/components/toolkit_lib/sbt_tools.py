@@ -8,9 +8,11 @@ from web3.contract import Contract
 from web3.exceptions import ContractLogicError, Web3Exception
 
 from .messages import tool_success, tool_error
-from .tx_helpers import fee_params, next_nonce, sign_and_send
+from .schemas import HAS_SBT_SCHEMA, GET_SCORE_SCHEMA, ISSUE_SCORE_SCHEMA, REVOKE_SCORE_SCHEMA
+from .tx_helpers import build_base_tx, fee_params, next_nonce, sign_and_send
 
 from ..config import PRIVATE_KEY_ENV
+from ..web3_utils import checksum_address
 
 
 _ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
@@ -61,6 +63,17 @@ def build_llm_toolkit(
     tools: list[Dict[str, Any]] = []
     handlers: Dict[str, Callable[..., str]] = {}
 
+    # Bind ContractFunction factories once; None when the ABI lacks the entry (fallbacks below).
+    functions = contract.functions
+    fn_has_sbt = getattr(functions, "hasSbt", None)
+    fn_token_id_of = getattr(functions, "tokenIdOf", None)
+    fn_owner_of = getattr(functions, "ownerOf", None)
+    fn_get_score = getattr(functions, "getScore", None)
+    fn_scores = getattr(functions, "scores", None)
+    fn_owner = getattr(functions, "owner", None)
+    fn_issue_score = getattr(functions, "issueScore", None)
+    fn_revoke_score = getattr(functions, "revokeScore", None)
+
     def register(
         name: str,
         description: str,
@@ -73,12 +86,12 @@ def build_llm_toolkit(
     # ---- Reads ----
     def hasSbt_tool(wallet_address: str) -> str:
         try:
-            checksum_wallet = Web3.to_checksum_address(wallet_address)
+            checksum_wallet = checksum_address(wallet_address)
         except ValueError:
             return tool_error("Invalid wallet address supplied.")
         # Preferred
         try:
-            has_fn = getattr(contract.functions, "hasSbt", None)
+            has_fn = fn_has_sbt
             if has_fn is not None:
                 has = bool(has_fn(checksum_wallet).call())
                 return tool_success({"wallet": checksum_wallet, "hasSbt": has, "strategy": "hasSbt"})
@@ -86,9 +99,9 @@ def build_llm_toolkit(
             pass
         # Fallback via ownerOf(tokenId)
         try:
-            tid_fn = getattr(contract.functions, "tokenIdOf", None)
+            tid_fn = fn_token_id_of
             tid = int(tid_fn(checksum_wallet).call()) if tid_fn else int(checksum_wallet, 16)
-            owner_of_fn = getattr(contract.functions, "ownerOf", None)
+            owner_of_fn = fn_owner_of
             if owner_of_fn is None:
                 fb = w3.eth.contract(
                     address=contract.address,
@@ -117,22 +130,18 @@ def build_llm_toolkit(
     register(
         "hasSbt",
         "Check whether a wallet has a TrustMint SBT.",
-        {
-            "type": "object",
-            "properties": {"wallet_address": {"type": "string", "description": "Wallet address to check."}},
-            "required": ["wallet_address"],
-        },
+        HAS_SBT_SCHEMA,
         hasSbt_tool,
     )
 
     def getScore_tool(wallet_address: str) -> str:
         try:
-            checksum_wallet = Web3.to_checksum_address(wallet_address)
+            checksum_wallet = checksum_address(wallet_address)
         except ValueError:
             return tool_error("Invalid wallet address supplied.")
         # Preferred getScore
         try:
-            score_fn = getattr(contract.functions, "getScore", None)
+            score_fn = fn_get_score
             if score_fn is not None:
                 value, timestamp, valid = score_fn(checksum_wallet).call()
                 return tool_success({"wallet": checksum_wallet, "value": int(value), "timestamp": int(timestamp), "valid": bool(valid), "strategy": "getScore"})
@@ -140,7 +149,7 @@ def build_llm_toolkit(
             pass
         # Fallback scores mapping
         try:
-            scores_fn = getattr(contract.functions, "scores", None)
+            scores_fn = fn_scores
             if scores_fn is not None:
                 value, timestamp, valid = scores_fn(checksum_wallet).call()
                 return tool_success({"wallet": checksum_wallet, "value": int(value), "timestamp": int(timestamp), "valid": bool(valid), "strategy": "scores"})
@@ -192,11 +201,7 @@ def build_llm_toolkit(
     register(
         "getScore",
         "Read the TrustMint SBT score tuple (value, timestamp, valid) for a wallet.",
-        {
-            "type": "object",
-            "properties": {"wallet_address": {"type": "string", "description": "Wallet address to query."}},
-            "required": ["wallet_address"],
-        },
+        GET_SCORE_SCHEMA,
         getScore_tool,
     )
 
@@ -204,7 +209,7 @@ def build_llm_toolkit(
     def _preflight_owner(owner_address: str) -> Optional[str]:
         """Return None if OK; otherwise error message."""
         try:
-            owner_fn = getattr(contract.functions, "owner", None)
+            owner_fn = fn_owner
             if owner_fn is None:
                 return None
             chain_owner = owner_fn().call()
@@ -218,7 +223,7 @@ def build_llm_toolkit(
         if not derived_private_key:
             return tool_error("PRIVATE_KEY not configured. Configure it in .env to submit transactions.")
         try:
-            checksum_wallet = Web3.to_checksum_address(wallet_address)
+            checksum_wallet = checksum_address(wallet_address)
         except ValueError:
             return tool_error("Invalid wallet address supplied.")
         try:
@@ -233,7 +238,7 @@ def build_llm_toolkit(
             score_value = int(score_value)
             fees = fee_params(w3, gas_price_gwei)
             nonce = next_nonce(w3, owner_acct.address)
-            fn = getattr(contract.functions, "issueScore", None)
+            fn = fn_issue_score
             if fn is None:
                 fb = w3.eth.contract(
                     address=contract.address,
@@ -252,18 +257,13 @@ def build_llm_toolkit(
                 )
                 fn = fb.functions.issueScore
             tx = fn(checksum_wallet, score_value).build_transaction(
-                {
-                    "from": owner_acct.address,
-                    "nonce": nonce,
-                    "gas": default_gas_limit,
-                    "chainId": w3.eth.chain_id,
-                    **fees,
-                }
+                build_base_tx(owner_acct.address, nonce, fees, w3.eth.chain_id, default_gas_limit)
             )
             sent = sign_and_send(w3, derived_private_key, tx)
-            if "error" in sent:
+            err = sent.get("error")
+            if err is not None:
                 # Retry once with fee bump if underpriced
-                if sent.get("status") == "underpriced" or "underpriced" in sent.get("error", ""):
+                if sent.get("status") == "underpriced" or "underpriced" in str(err):
                     # bump fees ~15%
                     if "maxFeePerGas" in fees:
                         fees_bumped = {
@@ -276,8 +276,9 @@ def build_llm_toolkit(
                     for k, v in fees_bumped.items():
                         tx[k] = v
                     sent = sign_and_send(w3, derived_private_key, tx)
-                if "error" in sent:
-                    return tool_error(sent["error"]) if isinstance(sent["error"], str) else tool_error(str(sent["error"]))
+                    err = sent.get("error")
+                if err is not None:
+                    return tool_error(err if isinstance(err, str) else str(err))
             return tool_success(sent)
         except ContractLogicError as exc:
             return tool_error(f"Contract rejected the transaction: {exc}")
@@ -289,14 +290,7 @@ def build_llm_toolkit(
     register(
         "issueScore",
         "Issue or update a TrustMint SBT credit score (owner-only).",
-        {
-            "type": "object",
-            "properties": {
-                "wallet_address": {"type": "string", "description": "Wallet address to score."},
-                "score_value": {"type": "integer", "description": "Numerical credit score to assign."},
-            },
-            "required": ["wallet_address", "score_value"],
-        },
+        ISSUE_SCORE_SCHEMA,
         issueScore_tool,
     )
 
@@ -304,7 +298,7 @@ def build_llm_toolkit(
         if not derived_private_key:
             return tool_error("PRIVATE_KEY not configured. Configure it in .env to submit transactions.")
         try:
-            checksum_wallet = Web3.to_checksum_address(wallet_address)
+            checksum_wallet = checksum_address(wallet_address)
         except ValueError:
             return tool_error("Invalid wallet address supplied.")
         try:
@@ -321,7 +315,7 @@ def build_llm_toolkit(
         try:
             fees = fee_params(w3, gas_price_gwei)
             nonce = next_nonce(w3, owner_acct.address)
-            fn = getattr(contract.functions, "revokeScore", None)
+            fn = fn_revoke_score
             if fn is None:
                 fb = w3.eth.contract(
                     address=contract.address,
@@ -337,18 +331,13 @@ def build_llm_toolkit(
                 )
                 fn = fb.functions.revokeScore
             tx = fn(checksum_wallet).build_transaction(
-                {
-                    "from": owner_acct.address,
-                    "nonce": nonce,
-                    "gas": default_gas_limit,
-                    "chainId": w3.eth.chain_id,
-                    **fees,
-                }
+                build_base_tx(owner_acct.address, nonce, fees, w3.eth.chain_id, default_gas_limit)
             )
             sent = sign_and_send(w3, derived_private_key, tx)
-            if "error" in sent:
+            err = sent.get("error")
+            if err is not None:
                 # Retry once with fee bump if underpriced
-                if sent.get("status") == "underpriced" or "underpriced" in sent.get("error", ""):
+                if sent.get("status") == "underpriced" or "underpriced" in str(err):
                     if "maxFeePerGas" in fees:
                         fees_bumped = {
                             "maxFeePerGas": int(fees["maxFeePerGas"] * 1.15),
@@ -360,8 +349,9 @@ def build_llm_toolkit(
                     for k, v in fees_bumped.items():
                         tx[k] = v
                     sent = sign_and_send(w3, derived_private_key, tx)
-                if "error" in sent:
-                    return tool_error(sent["error"]) if isinstance(sent["error"], str) else tool_error(str(sent["error"]))
+                    err = sent.get("error")
+                if err is not None:
+                    return tool_error(err if isinstance(err, str) else str(err))
             return tool_success(sent)
         except ContractLogicError as exc:
             return tool_error(f"Contract rejected the transaction: {exc}")
@@ -373,11 +363,7 @@ def build_llm_toolkit(
     register(
         "revokeScore",
         "Revoke (invalidate) an SBT borrower score (owner-only).",
-        {
-            "type": "object",
-            "properties": {"wallet_address": {"type": "string", "description": "Borrower wallet address."}},
-            "required": ["wallet_address"],
-        },
+        REVOKE_SCORE_SCHEMA,
         revokeScore_tool,
     )
 
@@ -390,7 +376,7 @@ def build_sbt_guard(
 ) -> Callable[[str], Optional[str]]:
     def guard(wallet_address: str) -> Optional[str]:
         try:
-            checksum_wallet = Web3.to_checksum_address(wallet_address)
+            checksum_wallet = checksum_address(wallet_address)
         except ValueError:
             return "Borrower wallet address is invalid."
         if _has_sbt(w3, contract, checksum_wallet):
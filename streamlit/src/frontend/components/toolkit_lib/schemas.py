@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from typing import Any, Dict
+
+# JSON-schema parameter blocks for the tool specs. Built once at import and shared by every toolkit
+# build, so treat them as read-only.
+NO_ARGS_SCHEMA: Dict[str, Any] = {"type": "object", "properties": {}, "required": []}
+LENDER_ADDRESS_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {"lender_address": {"type": "string", "description": "Lender wallet address."}},
+    "required": ["lender_address"],
+}
+BORROWER_ADDRESS_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {"borrower_address": {"type": "string", "description": "Borrower wallet address."}},
+    "required": ["borrower_address"],
+}
+DEPOSIT_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {"amount": {"type": "number", "description": "Amount in human units (e.g., 100 USDC)."}},
+    "required": ["amount"],
+}
+WITHDRAW_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {"amount": {"type": "number", "description": "Amount in human units."}},
+    "required": ["amount"],
+}
+OPEN_LOAN_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "borrower_address": {"type": "string", "description": "Borrower wallet address."},
+        "principal": {"type": "number", "description": "Principal in human units (e.g., 50 USDC)."},
+        "term_seconds": {"type": "integer", "description": "Loan term in seconds (e.g., 604800 for 7 days)."},
+    },
+    "required": ["borrower_address", "principal", "term_seconds"],
+}
+UNBAN_BATCH_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "borrower_addresses": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": "Borrower wallet addresses to unban.",
+        }
+    },
+    "required": ["borrower_addresses"],
+}
+
+HAS_SBT_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {"wallet_address": {"type": "string", "description": "Wallet address to check."}},
+    "required": ["wallet_address"],
+}
+GET_SCORE_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {"wallet_address": {"type": "string", "description": "Wallet address to query."}},
+    "required": ["wallet_address"],
+}
+ISSUE_SCORE_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "wallet_address": {"type": "string", "description": "Wallet address to score."},
+        "score_value": {"type": "integer", "description": "Numerical credit score to assign."},
+    },
+    "required": ["wallet_address", "score_value"],
+}
+REVOKE_SCORE_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {"wallet_address": {"type": "string", "description": "Borrower wallet address."}},
+    "required": ["wallet_address"],
+}
+
+ARC_TRANSFER_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "arc_recipient": {"type": "string", "description": "ARC recipient wallet address."},
+        "amount": {"type": "string", "description": "Amount of USDC to transfer (e.g., 0.10)."},
+    },
+    "required": ["arc_recipient", "amount"],
+}
+START_BRIDGE_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "polygon_address": {"type": "string", "description": "Destination Polygon wallet address."},
+        "amount": {"type": "string", "description": "Amount of USDC to bridge (e.g., 0.10)."},
+        "wait_for_attestation": {
+            "type": "boolean",
+            "description": "If true, wait for Circle attestation before returning.",
+            "default": False,
+        },
+    },
+    "required": ["polygon_address", "amount"],
+}
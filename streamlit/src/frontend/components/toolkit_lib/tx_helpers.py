@@ -1,15 +1,16 @@
 from __future__ import annotations
 
 import os
+import time
 from typing import Any, Dict, Optional, Tuple
 
 from web3 import Web3
 from web3.contract import Contract
-from web3.exceptions import Web3Exception
+from web3.exceptions import TimeExhausted, TransactionNotFound, Web3Exception
 
 import streamlit as st
 
-from ..web3_utils import encode_contract_call
+from ..web3_utils import checksum_address, encode_contract_call
 
 _CUSTOM_ERROR_MAP: Dict[str, Tuple[str, Tuple[str, ...]]] = {
     "33b2879b": ("DepositAmountZero", ()),
@@ -37,43 +38,64 @@ _CUSTOM_ERROR_MAP: Dict[str, Tuple[str, Tuple[str, ...]]] = {
 }
 
 
-def supports_eip1559(w3: Web3) -> bool:
+def fee_params(w3: Web3, gas_price_gwei: str) -> Dict[str, int]:
+    """Return fee params for tx: EIP-1559 when supported; otherwise legacy gasPrice.
+    Env overrides (optional): ARC_PRIORITY_FEE_GWEI, ARC_MAX_FEE_GWEI
+    """
     try:
         latest = w3.eth.get_block("latest")
-        return "baseFeePerGas" in latest and latest["baseFeePerGas"] is not None
     except Exception:
-        return False
+        latest = None
+    return fee_params_from_block(latest, gas_price_gwei)
 
 
-def fee_params(w3: Web3, gas_price_gwei: str) -> Dict[str, int]:
-    """Return fee params for tx: EIP-1559 when supported; otherwise legacy gasPrice.
-    Env overrides (optional): ARC_PRIORITY_FEE_GWEI, ARC_MAX_FEE_GWEI
-    """
-    if supports_eip1559(w3):
+def fee_params_from_block(latest: Any, gas_price_gwei: str) -> Dict[str, int]:
+    """``fee_params`` for an already-fetched ``latest`` block (e.g. one returned by a batch request)."""
+    base = latest.get("baseFeePerGas") if latest is not None else None
+    if base is None:
+        return {"gasPrice": Web3.to_wei(int(gas_price_gwei), "gwei")}
+    prio_gwei = int(os.getenv("ARC_PRIORITY_FEE_GWEI", "1"))
+    max_gwei = os.getenv("ARC_MAX_FEE_GWEI")
+    prio = Web3.to_wei(prio_gwei, "gwei")
+    max_fee = int(base) * 2 + prio
+    if max_gwei:
         try:
-            latest = w3.eth.get_block("latest")
-            base = int(latest["baseFeePerGas"])  # wei
+            max_fee = Web3.to_wei(int(max_gwei), "gwei")
         except Exception:
-            base = Web3.to_wei(int(gas_price_gwei), "gwei") // 2
-        prio_gwei = int(os.getenv("ARC_PRIORITY_FEE_GWEI", "1"))
-        max_gwei = os.getenv("ARC_MAX_FEE_GWEI")
-        prio = Web3.to_wei(prio_gwei, "gwei")
-        max_fee = base * 2 + prio
-        if max_gwei:
-            try:
-                max_fee = Web3.to_wei(int(max_gwei), "gwei")
-            except Exception:
-                pass
-        return {"maxFeePerGas": max_fee, "maxPriorityFeePerGas": prio}
-    return {"gasPrice": Web3.to_wei(int(gas_price_gwei), "gwei")}
-
-
-def next_nonce(w3: Web3, addr: str) -> int:
-    """Pending nonce + session monotonic bump to avoid duplicates on fast clicks."""
+            pass
+    return {"maxFeePerGas": max_fee, "maxPriorityFeePerGas": prio}
+
+
+def build_base_tx(
+    signer: str,
+    nonce: int,
+    fees: Dict[str, int],
+    chain_id: int,
+    gas: int,
+    value_wei: int = 0,
+) -> Dict[str, Any]:
+    """Base ``build_transaction`` params; ``fees`` is the EIP-1559 or legacy dict from ``fee_params``."""
+    tx: Dict[str, Any] = {"from": signer, "nonce": nonce, "gas": gas, "chainId": chain_id, **fees}
+    if value_wei:
+        tx["value"] = value_wei
+    return tx
+
+
+def pending_nonce(w3: Web3, addr: str) -> int:
+    """Pending transaction count from the node (pure RPC; safe to prefetch off the script thread)."""
     try:
-        pending = w3.eth.get_transaction_count(addr, "pending")
+        return w3.eth.get_transaction_count(addr, "pending")
     except Exception:
-        pending = w3.eth.get_transaction_count(addr)
+        return w3.eth.get_transaction_count(addr)
+
+
+def next_nonce(w3: Web3, addr: str, pending: Optional[int] = None) -> int:
+    """Pending nonce + session monotonic bump to avoid duplicates on fast clicks.
+
+    ``pending`` may carry a count prefetched via ``pending_nonce``; the session bump is applied here.
+    """
+    if pending is None:
+        pending = pending_nonce(w3, addr)
     key = f"_nonce_{addr.lower()}"
     last = st.session_state.get(key)
     if isinstance(last, int) and pending <= last:
@@ -82,6 +104,34 @@ def next_nonce(w3: Web3, addr: str) -> int:
     return pending
 
 
+def poll_receipt(
+    w3: Web3,
+    tx_hash: Any,
+    *,
+    initial: float = 0.5,
+    max_interval: float = 3.5,
+    timeout: float = 120.0,
+) -> Any:
+    """Wait for a receipt, doubling the poll interval from ``initial`` up to ``max_interval``.
+
+    Checks once immediately so fast confirmations return without sleeping. Raises ``TimeExhausted``
+    after ``timeout`` seconds, like ``wait_for_transaction_receipt``.
+    """
+    deadline = time.monotonic() + timeout
+    interval = initial
+    while True:
+        try:
+            return w3.eth.get_transaction_receipt(tx_hash)
+        except TransactionNotFound:
+            pass
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            shown = Web3.to_hex(tx_hash) if isinstance(tx_hash, (bytes, bytearray)) else tx_hash
+            raise TimeExhausted(f"Transaction {shown} is not in the chain after {timeout} seconds")
+        time.sleep(min(interval, remaining))
+        interval = min(interval * 2, max_interval)
+
+
 def sign_and_send(w3: Web3, private_key: str, tx: Dict[str, Any]) -> Dict[str, Any]:
     try:
         signed = w3.eth.account.sign_transaction(tx, private_key=private_key)
@@ -91,7 +141,7 @@ def sign_and_send(w3: Web3, private_key: str, tx: Dict[str, Any]) -> Dict[str, A
         local_hash = Web3.keccak(raw_tx).hex()
         try:
             tx_hash = w3.eth.send_raw_transaction(raw_tx)
-            receipt = w3.eth.wait_for_transaction_receipt(tx_hash)
+            receipt = poll_receipt(w3, tx_hash)
             formatted = format_receipt(receipt)
             status = formatted.get("status")
             if status in (1, True):
@@ -220,7 +270,7 @@ def metamask_tx_request(
         req["value"] = hex(value_wei)
     if from_address:
         try:
-            req["from"] = Web3.to_checksum_address(from_address)
+            req["from"] = checksum_address(from_address)
         except Exception:
             req["from"] = from_address
     return req
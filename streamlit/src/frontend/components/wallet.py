@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import functools
 from decimal import Decimal, InvalidOperation
 from pathlib import Path
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
 
 import os
 import streamlit as st
@@ -32,8 +34,13 @@ POLYGON_COMMAND_STATE_KEY = "polygon_wallet_command"
 POLYGON_COMMAND_SEQ_KEY = "polygon_wallet_command_seq"
 POLYGON_COMMAND_ARGS_KEY = "polygon_wallet_command_args"
 
+# Shared read-only fallback for "no wallet cached yet"; avoids a fresh dict per rerun.
+_EMPTY_WALLET: Mapping[str, Any] = MappingProxyType({})
 
+
+@functools.lru_cache(maxsize=1)
 def _resolve_chain_id() -> Optional[int]:
+    """ARC_CHAIN_ID as an int; env vars are fixed for the process, so this is parsed once."""
     raw = os.getenv(ARC_CHAIN_ID_ENV)
     if not raw:
         return None
@@ -473,7 +480,7 @@ def render_wallet_page() -> None:
     col_left, col_right = st.columns([2, 1])
     with col_right:
         st.subheader("Session State")
-        stored: Dict[str, Any] = st.session_state.get(DEFAULT_SESSION_KEY, {})  # type: ignore[assignment]
+        stored: Mapping[str, Any] = st.session_state.get(DEFAULT_SESSION_KEY, _EMPTY_WALLET)  # type: ignore[assignment]
         if stored.get("isConnected") and stored.get("address"):
             st.success(f"Cached address: {stored['address']}")
             st.json(stored)
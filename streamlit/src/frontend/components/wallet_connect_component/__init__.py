@@ -1,3 +1,4 @@
+import functools
 import os
 import time
 from pathlib import Path
@@ -14,11 +15,14 @@ import streamlit.components.v1 as components
 #       st.session_state["wallet_address"] = info["address"]
 
 
+@functools.lru_cache(maxsize=1)
 def _declare_component() -> Any:
     """Declare the Streamlit component.
 
     - Prefer static assets under `frontend/build` so no dev server is required.
     - Allow overriding with `WALLET_CONNECT_DEV_URL` during local development.
+
+    Memoised and called on first render, so the build check runs once per process instead of at import.
     """
     dev_url = os.getenv("WALLET_CONNECT_DEV_URL")
     if dev_url:
@@ -26,21 +30,20 @@ def _declare_component() -> Any:
 
     build_dir = Path(__file__).parent / "frontend" / "build"
     index_html = build_dir / "index.html"
-    if not index_html.exists():
+    try:
+        os.stat(index_html)
+    except OSError:
         raise RuntimeError(
             "Wallet Connect component build not found.\n"
             "Run the frontend build once before using the component:\n"
             f"  cd {build_dir.parent}\n"
             "  npm install\n"
             "  npm run build"
-        )
+        ) from None
 
     return components.declare_component("wallet_connect", path=str(build_dir))
 
 
-_component = _declare_component()
-
-
 def connect_wallet(
     key: Optional[str] = None,
     require_chain_id: Optional[int] = None,
@@ -93,7 +96,7 @@ def connect_wallet(
         args["command_payload"] = command_payload
     if command_sequence is not None:
         args["command_sequence"] = command_sequence
-    return _component(default=None, key=key, **args)
+    return _declare_component()(default=None, key=key, **args)
 
 
 def wallet_command(
@@ -1,12 +1,121 @@
 """Web3 helper utilities for the Streamlit frontend."""
 from __future__ import annotations
 
+import functools
 import json
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Optional, Sequence
+from typing import Any, Callable, Optional, Sequence
 
 from web3 import Web3
 from web3.contract import Contract
+from web3.middleware import Web3Middleware
+
+_RPC_CACHE_MAXSIZE = 4096
+_RPC_CACHE: "OrderedDict[str, Any]" = OrderedDict()
+_RPC_CACHE_LOCK = threading.Lock()
+_ALWAYS_CACHEABLE_METHODS = frozenset({"eth_chainId", "net_version", "eth_getCode"})
+_CONTRACT_CACHE_MAXSIZE = 64
+_CONTRACT_CACHE: dict[tuple, Contract] = {}
+_CONTRACT_CACHE_LOCK = threading.Lock()
+
+
+def endpoint_key(w3: Web3) -> str:
+    """Identify ``w3``'s node for process-wide caches: its RPC URL, else the provider's id."""
+    return str(getattr(w3.provider, "endpoint_uri", "") or id(w3.provider))
+
+
+@functools.lru_cache(maxsize=None)
+def rpc_executor() -> ThreadPoolExecutor:
+    """Process-wide worker pool for independent RPCs; HTTPProvider releases the GIL while waiting."""
+    return ThreadPoolExecutor(max_workers=8, thread_name_prefix="web3-rpc")
+
+
+def _is_concrete_block(value: Any) -> bool:
+    return isinstance(value, int) or (isinstance(value, str) and value.startswith("0x"))
+
+
+def _rpc_cache_key(endpoint: str, method: str, params: Any) -> Optional[str]:
+    """Return a cache key for immutable JSON-RPC requests, or None if the call must hit the node."""
+    if method == "eth_call":
+        # Only calls pinned to an explicit block are immutable; "latest"/"pending" stay uncached.
+        if not (isinstance(params, (list, tuple)) and len(params) > 1 and _is_concrete_block(params[1])):
+            return None
+    elif method not in _ALWAYS_CACHEABLE_METHODS:
+        return None
+    try:
+        return f"{endpoint}|{method}|{json.dumps(params, sort_keys=True, default=str)}"
+    except (TypeError, ValueError):
+        return None
+
+
+def _rpc_cache_get(key: str) -> Any:
+    with _RPC_CACHE_LOCK:
+        if key in _RPC_CACHE:
+            _RPC_CACHE.move_to_end(key)
+            return _RPC_CACHE[key]
+    return None
+
+
+def _rpc_cache_put(key: str, response: Any) -> None:
+    with _RPC_CACHE_LOCK:
+        _RPC_CACHE[key] = response
+        _RPC_CACHE.move_to_end(key)
+        while len(_RPC_CACHE) > _RPC_CACHE_MAXSIZE:
+            _RPC_CACHE.popitem(last=False)
+
+
+class RPCCacheMiddleware(Web3Middleware):
+    """Memoize immutable JSON-RPC responses (chain id, contract code, block-pinned eth_call).
+
+    Responses are kept in a process-wide LRU so Streamlit reruns and sessions share them.
+    """
+
+    def wrap_make_request(self, make_request: Callable[..., Any]) -> Callable[..., Any]:
+        endpoint = endpoint_key(self._w3)
+
+        def middleware(method: Any, params: Any) -> Any:
+            key = _rpc_cache_key(endpoint, str(method), params)
+            if key is None:
+                return make_request(method, params)
+            cached = _rpc_cache_get(key)
+            if cached is not None:
+                return cached
+            response = make_request(method, params)
+            result = response.get("result") if isinstance(response, dict) else None
+            # Skip errors and empty code (the contract may simply not be deployed yet).
+            if result not in (None, "0x", b"") and "error" not in response:
+                _rpc_cache_put(key, response)
+            return response
+
+        return middleware
+
+
+def install_rpc_cache(client: Web3) -> Web3:
+    """Attach the immutable-response cache middleware to ``client`` (idempotent)."""
+    try:
+        client.middleware_onion.add(RPCCacheMiddleware, name="rpc_cache")
+    except ValueError:
+        pass  # already installed
+    return client
+
+
+@functools.lru_cache(maxsize=1024)
+def _checksum_lower(address: str) -> str:
+    return Web3.to_checksum_address(address)
+
+
+def checksum_address(address: str) -> str:
+    """Memoized ``Web3.to_checksum_address``; mixed-case spellings share one cache entry.
+
+    Raises ValueError for malformed or non-string addresses.
+    """
+    if not isinstance(address, str):
+        raise ValueError(f"Address must be a string, got {type(address).__name__}")
+    return _checksum_lower(address.lower())
 
 
 def get_web3_client(rpc_url: Optional[str]) -> Optional[Web3]:
@@ -17,9 +126,10 @@ def get_web3_client(rpc_url: Optional[str]) -> Optional[Web3]:
     if not rpc_url:
         return None
     try:
-        w3 = Web3(Web3.HTTPProvider(rpc_url))
-        # Optional ping; if provider is down this may raise
-        _ = w3.eth.chain_id  # noqa: F841
+        w3 = install_rpc_cache(Web3(Web3.HTTPProvider(rpc_url)))
+        # Optional ping; if provider is down this may raise. eth_blockNumber is never cached, so
+        # unlike eth_chainId this really reaches the node.
+        _ = w3.eth.block_number  # noqa: F841
         return w3
     except Exception:
         return None
@@ -29,10 +139,59 @@ def load_contract_abi(abi_path: Optional[str]) -> Optional[list[dict[str, Any]]]
     """Load a contract ABI JSON from disk.
 
     Accepts an absolute or relative path string. If relative, resolves from repo root.
-    Returns None on any error.
+    Returns None on any error. Parsed ABIs are memoized per path and modification time.
     """
     if not abi_path:
         return None
+    return _load_contract_abi_cached(abi_path, _abi_mtime(abi_path))
+
+
+def load_contract(
+    w3: Web3, address: str, abi_path: Optional[str] = None, *, abi_text: Optional[str] = None
+) -> Optional[Contract]:
+    """Return a contract for ``address``, built once per endpoint, address and ABI source.
+
+    The ABI comes from ``abi_path`` (re-read when the file changes, like ``load_contract_abi``) or
+    from pasted ``abi_text``; returns None when neither is given. A missing or malformed ABI file,
+    ABI text or address raises, as ``load_contract_abi`` and ``Web3.eth.contract`` do.
+    """
+    if abi_path:
+        abi_source: Any = (abi_path, _abi_mtime(abi_path))
+    elif abi_text:
+        abi_source = abi_text
+    else:
+        return None
+    key = (endpoint_key(w3), address, abi_source)
+    with _CONTRACT_CACHE_LOCK:
+        contract = _CONTRACT_CACHE.get(key)
+    if contract is not None:
+        return contract
+
+    abi = _load_contract_abi_cached(*abi_source) if abi_path else json.loads(abi_text)
+    contract = w3.eth.contract(address=checksum_address(address), abi=abi)
+    with _CONTRACT_CACHE_LOCK:
+        _CONTRACT_CACHE[key] = contract
+        while len(_CONTRACT_CACHE) > _CONTRACT_CACHE_MAXSIZE:
+            _CONTRACT_CACHE.pop(next(iter(_CONTRACT_CACHE)))
+    return contract
+
+
+def _abi_mtime(abi_path: str) -> Optional[int]:
+    try:
+        return os.stat(_resolve_abi_path(abi_path)).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _resolve_abi_path(abi_path: str) -> Path:
+    p = Path(abi_path).expanduser()
+    if not p.is_absolute():
+        return Path(__file__).resolve().parents[4] / p
+    return p
+
+
+@functools.lru_cache(maxsize=64)
+def _load_contract_abi_cached(abi_path: str, mtime: Optional[int]) -> Optional[list[dict[str, Any]]]:
     try:
         # Resolve path: if relative, resolve from repo root (where .env is loaded)
         p = Path(abi_path).expanduser()